@@ -1,5 +1,7 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.db import transaction
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from .models import User
 
@@ -61,7 +63,7 @@ class UserAdmin(BaseUserAdmin):
     )
     
     # 読み取り専用フィールド
-    readonly_fields = ['created_at', 'updated_at', 'last_login', 'last_login_at']
+    readonly_fields = ['full_name', 'created_at', 'updated_at', 'last_login', 'last_login_at']
     
     # インライン編集を有効にする
     list_editable = ['is_active', 'is_admin', 'is_staff', 'department']
@@ -72,26 +74,42 @@ class UserAdmin(BaseUserAdmin):
     # アクションの追加
     actions = ['activate_users', 'deactivate_users', 'make_admin', 'remove_admin']
     
+    def get_queryset(self, request):
+        """一覧画面ではパスワードハッシュを読み込まない"""
+        queryset = super().get_queryset(request)
+        changelist_url_name = f'{self.opts.app_label}_{self.opts.model_name}_changelist'
+        if request.resolver_match and request.resolver_match.url_name == changelist_url_name:
+            queryset = queryset.defer('password')
+        return queryset
+    
+    def _bulk_update(self, queryset, **values):
+        """
+        選択したユーザーをオブジェクトを読み込まずに1回のUPDATEで更新する
+        update()はauto_nowを反映しないため、更新日時も明示的に設定する
+        """
+        with transaction.atomic():
+            return queryset.update(updated_at=timezone.now(), **values)
+    
     def activate_users(self, request, queryset):
         """選択したユーザーを有効化"""
-        updated = queryset.update(is_active=True)
+        updated = self._bulk_update(queryset, is_active=True)
         self.message_user(request, f'{updated}件のユーザーを有効化しました。')
     activate_users.short_description = '選択したユーザーを有効化'
     
     def deactivate_users(self, request, queryset):
         """選択したユーザーを無効化"""
-        updated = queryset.update(is_active=False)
+        updated = self._bulk_update(queryset, is_active=False)
         self.message_user(request, f'{updated}件のユーザーを無効化しました。')
     deactivate_users.short_description = '選択したユーザーを無効化'
     
     def make_admin(self, request, queryset):
         """選択したユーザーに管理者権限を付与"""
-        updated = queryset.update(is_admin=True)
+        updated = self._bulk_update(queryset, is_admin=True)
         self.message_user(request, f'{updated}件のユーザーに管理者権限を付与しました。')
     make_admin.short_description = '管理者権限を付与'
     
     def remove_admin(self, request, queryset):
         """選択したユーザーから管理者権限を削除"""
-        updated = queryset.update(is_admin=False)
+        updated = self._bulk_update(queryset, is_admin=False)
         self.message_user(request, f'{updated}件のユーザーから管理者権限を削除しました。')
     remove_admin.short_description = '管理者権限を削除'
\ No newline at end of file
@@ -14,10 +14,16 @@ class UseridBackend(ModelBackend):
         useridでユーザー認証を行う
         DjangoのデフォルトはusernameパラメータのためSuseridをusernameとして受け取る
         """
+        if username is None or password is None:
+            return None
+
         try:
             # usernameパラメータをuseridとして使用
             user = User.objects.get(userid=username)
         except User.DoesNotExist:
+            # 存在しないユーザーでも同じだけハッシュ計算を行い、
+            # 応答時間の差からユーザーIDの存在が推測されないようにする
+            User().set_password(password)
             return None
         
         if user.check_password(password) and self.user_can_authenticate(user):
@@ -0,0 +1,13 @@
+# api/accounts/hashers.py
+
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    社内業務システム向けにコストを調整したArgon2ハッシャー
+    OWASPの推奨する最小構成（argon2id、メモリ19MiB・反復2回・並列度1）を下回らない範囲でコストを抑える
+    """
+    time_cost = 2
+    memory_cost = 19456
+    parallelism = 1
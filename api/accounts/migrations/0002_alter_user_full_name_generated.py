@@ -0,0 +1,39 @@
+# Generated by Django 5.2.7 on 2026-10-15 10:12
+
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="user",
+            name="full_name",
+        ),
+        migrations.AddField(
+            model_name="user",
+            name="full_name",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.functions.text.Trim(
+                    django.db.models.functions.text.Concat(
+                        django.db.models.functions.comparison.Coalesce(
+                            "last_name", models.Value("")
+                        ),
+                        models.Value(" "),
+                        django.db.models.functions.comparison.Coalesce(
+                            "first_name", models.Value("")
+                        ),
+                    )
+                ),
+                output_field=models.CharField(max_length=101),
+                verbose_name="フルネーム",
+            ),
+        ),
+    ]
@@ -1,7 +1,8 @@
-from turtle import Turtle
 from django.db import models
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
+from django.db.models.functions import Coalesce, Concat, Trim
 from django.utils import timezone
+from django.utils.functional import cached_property
 
 # Create your models here.
 
@@ -60,9 +61,15 @@ class User(AbstractBaseUser, PermissionsMixin):
         null=True,
         verbose_name="性"
     )
-    full_name = models.CharField(
-        max_length=100,
-        blank=True,
+    # 「性 名」をDB側で生成する
+    full_name = models.GeneratedField(
+        expression=Trim(Concat(
+            Coalesce('last_name', models.Value('')),
+            models.Value(' '),
+            Coalesce('first_name', models.Value('')),
+        )),
+        output_field=models.CharField(max_length=101),
+        db_persist=True,
         verbose_name="フルネーム"
     )
     phone_number = models.CharField(
@@ -129,18 +136,17 @@ class User(AbstractBaseUser, PermissionsMixin):
     
     def save(self, *args, **kwargs):
         """保存時の処理"""
-        # フルネーム自動生成
-        if self.first_name and self.last_name and not self.full_name:
-            self.full_name = f"{self.last_name} {self.first_name}"
-
         if self.last_login:
             self.last_login_at = self.last_login
 
+        # 権限が変更された場合に備えて、管理者判定のキャッシュを破棄
+        self.__dict__.pop('is_administrator', None)
+
         super().save(*args, **kwargs)
 
-    @property
+    @cached_property
     def is_administrator(self):
-        """管理者権限の確認"""
+        """管理者権限の確認（リクエスト中はインスタンスにキャッシュ）"""
         return self.is_admin or self.is_superuser or self.is_staff
     
 
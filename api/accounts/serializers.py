@@ -1,11 +1,13 @@
 from rest_framework import serializers
 from django.contrib.auth import authenticate
+from django.core.cache import cache
 from django.contrib.auth.password_validation import validate_password
 from .models import User
 
 
 class UserSerializer(serializers.ModelSerializer):
     """ユーザー情報のシリアライザー"""
+    is_administrator = serializers.BooleanField(read_only=True)
 
     class Meta:
         model = User
@@ -16,11 +18,44 @@ class UserSerializer(serializers.ModelSerializer):
             'updated_at', 'last_login_at'
         ]
         read_only_fields = [
-            'id', 'created_at', 'updated_at', 
+            'id', 'full_name', 'created_at', 'updated_at', 
             'last_login_at', 'is_administrator'
         ]
 
 
+# values()で取得する列（is_administratorはクエリセットでアノテーションする）
+USER_LIST_VALUES = UserSerializer.Meta.fields
+
+def serialize_user_rows(rows):
+    """
+    values()で取得した行をUserSerializerと同じ形式の辞書に変換する
+    一覧表示でモデルの生成とフィールド解決を省略するために使用
+    日時はORJSONRendererでDateTimeFieldと同じ形式に変換する
+    """
+    return [
+        {field: row[field] for field in UserSerializer.Meta.fields}
+        for row in rows
+    ]
+
+
+# シリアライズ済みユーザー情報のキャッシュ保持時間（秒）
+USER_PAYLOAD_CACHE_TIMEOUT = 300
+
+
+def get_cached_user_payload(user):
+    """
+    UserSerializerの出力をキャッシュから取得する
+    キーに更新日時・最終ログイン日時を含めるため、保存されると自動的に無効になる
+    """
+    last_login_at = user.last_login_at.timestamp() if user.last_login_at else 0
+    key = f'user_payload:{user.pk}:{user.updated_at.timestamp()}:{last_login_at}'
+    return cache.get_or_set(
+        key,
+        lambda: dict(UserSerializer(user).data),
+        USER_PAYLOAD_CACHE_TIMEOUT
+    )
+
+
 class UserCreateSerializer(serializers.ModelSerializer):
     """ユーザー作成用のシリアライザー"""
     password = serializers.CharField(
@@ -40,7 +75,7 @@ class UserCreateSerializer(serializers.ModelSerializer):
         model = User
         fields = [
             'userid', 'email', 'password', 'password2', 
-            'first_name', 'last_name', 'full_name', 
+            'first_name', 'last_name', 
             'phone_number', 'department', 'is_admin', 'is_staff'
         ]
         extra_kwargs = {
@@ -61,10 +96,8 @@ class UserCreateSerializer(serializers.ModelSerializer):
         validated_data.pop('password2')
         password = validated_data.pop('password')
 
-        user = User.objects.create(**validated_data)
-        user.set_password(password)
-        user.save()
-        return user
+        # パスワードのハッシュ化と保存を1回のINSERTで行う
+        return User.objects.create_user(password=password, **validated_data)
 
 
 class UserUpdateSerializer(serializers.ModelSerializer):
@@ -73,7 +106,7 @@ class UserUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = [
-            'email', 'first_name', 'last_name', 'full_name', 
+            'email', 'first_name', 'last_name', 
             'phone_number', 'department', 'is_active', 
             'is_admin', 'is_staff'
         ]
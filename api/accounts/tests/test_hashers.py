@@ -0,0 +1,18 @@
+from django.test import SimpleTestCase
+
+from api.accounts.hashers import TunedArgon2PasswordHasher
+
+
+class TunedArgon2PasswordHasherTests(SimpleTestCase):
+    """パスワードハッシャーのコストのテスト"""
+
+    hasher = TunedArgon2PasswordHasher()
+
+    def test_owasp_minimum_cost(self):
+        encoded = self.hasher.encode('password', self.hasher.salt())
+        decoded = self.hasher.decode(encoded)
+        self.assertEqual(decoded['variety'], 'argon2id')
+        self.assertGreaterEqual(decoded['memory_cost'], 19456)
+        self.assertGreaterEqual(decoded['time_cost'], 2)
+        self.assertTrue(self.hasher.verify('password', encoded))
+        self.assertFalse(self.hasher.must_update(encoded))
@@ -0,0 +1,32 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from api.accounts.models import User
+from api.accounts.serializers import UserSerializer
+
+
+class UserListTests(TestCase):
+    """ユーザー一覧（values()の辞書から出力）のテスト"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+        cls.user = User.objects.create_user(
+            'user1', 'user1@example.com', 'password', last_name='山田', first_name='太郎'
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_rows_match_serializer(self):
+        response = self.client.get('/api/accounts/users/')
+        self.assertEqual(response.status_code, 200)
+
+        rows = {row['userid']: row for row in response.json()['results']}
+        for user in (self.admin, self.user):
+            user.refresh_from_db()
+            self.assertEqual(rows[user.userid], dict(UserSerializer(user).data))
+        self.assertEqual(rows['user1']['full_name'], '山田 太郎')
+        self.assertIs(rows['admin']['is_administrator'], True)
+        self.assertIs(rows['user1']['is_administrator'], False)
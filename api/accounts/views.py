@@ -6,12 +6,14 @@ from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from django.contrib.auth import authenticate
+from django.db.models import BooleanField, ExpressionWrapper, Q
 from django.utils import timezone
 
 from .models import User
 from .serializers import (
     UserSerializer, UserCreateSerializer, UserUpdateSerializer, 
-    ChangePasswordSerializer, LoginSerializer
+    ChangePasswordSerializer, LoginSerializer, get_cached_user_payload,
+    USER_LIST_VALUES, serialize_user_rows
 )
 
 
@@ -28,10 +30,11 @@ class LoginView(views.APIView):
         serializer.is_valid(raise_exception=True)
         user = serializer.validated_data['user']
 
-        # 最終ログイン時刻を更新
-        user.last_login = timezone.now()
-        user.last_login_at = user.last_login
-        user.save(update_fields=['last_login', 'last_login_at'])
+        # 最終ログイン時刻を更新（save()を経由せず1回のUPDATEで反映）
+        now = timezone.now()
+        User.objects.filter(pk=user.pk).update(last_login=now, last_login_at=now)
+        user.last_login = now
+        user.last_login_at = now
 
         # JWTトークンを生成
         refresh = RefreshToken.for_user(user)
@@ -39,7 +42,7 @@ class LoginView(views.APIView):
         return Response({
             'refresh': str(refresh),
             'access': str(refresh.access_token),
-            'user': UserSerializer(user).data,
+            'user': get_cached_user_payload(user),
         }, status=status.HTTP_200_OK)
 
 
@@ -78,7 +81,12 @@ class IsAdminUser(permissions.BasePermission):
 
 class UserListCreateView(generics.ListCreateAPIView):
     """ユーザー一覧取得・作成ビュー"""
-    queryset = User.objects.all()
+    # UserSerializerで使用する列のみ取得（is_administratorはis_superuserも参照）
+    queryset = User.objects.only(
+        'id', 'userid', 'email', 'first_name', 'last_name', 'full_name',
+        'phone_number', 'department', 'is_active', 'is_staff', 'is_admin',
+        'is_superuser', 'created_at', 'updated_at', 'last_login_at'
+    )
     permission_classes = [IsAuthenticated, IsAdminUser]
 
     def get_serializer_class(self):
@@ -86,6 +94,25 @@ class UserListCreateView(generics.ListCreateAPIView):
             return UserCreateSerializer
         return UserSerializer
 
+    def get_queryset(self):
+        """管理者判定をSQL側で算出したクエリセット"""
+        return super().get_queryset().annotate(
+            is_administrator=ExpressionWrapper(
+                Q(is_admin=True) | Q(is_superuser=True) | Q(is_staff=True),
+                output_field=BooleanField()
+            )
+        )
+
+    def list(self, request, *args, **kwargs):
+        """ユーザー一覧（モデルを生成せずvalues()の辞書から返す）"""
+        queryset = self.filter_queryset(self.get_queryset()).values(*USER_LIST_VALUES)
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serialize_user_rows(page))
+
+        return Response(serialize_user_rows(queryset))
+
     def perform_create(self, serializer):
         serializer.save()
 
@@ -142,8 +169,7 @@ class CurrentUserView(views.APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        serializer = UserSerializer(request.user)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(get_cached_user_payload(request.user), status=status.HTTP_200_OK)
 
 
 class ChangePasswordView(generics.UpdateAPIView):
@@ -176,5 +202,5 @@ class CheckAuthView(views.APIView):
         return Response({
             "is_authenticated": True,
             'is_admin': request.user.is_administrator,
-            "user": UserSerializer(request.user).data
+            "user": get_cached_user_payload(request.user)
         }, status=status.HTTP_200_OK)
\ No newline at end of file
@@ -0,0 +1,81 @@
+# api/common/cache.py
+
+import hashlib
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework.response import Response
+
+# 一覧レスポンスのキャッシュ保持時間（秒）
+LIST_CACHE_TIMEOUT = 30
+
+
+def _version_key(namespace):
+    """
+    一覧キャッシュの世代番号のキー
+    世代番号は更新されるたびに変わり、古いキャッシュは参照されなくなる
+    """
+    return f'{namespace}:list_version'
+
+
+def _list_cache_version(namespace):
+    """一覧キャッシュの世代番号を取得（未設定・破棄済みの場合は現在時刻で初期化）"""
+    return cache.get_or_set(_version_key(namespace), time.time_ns, None)
+
+
+def get_cached_list_data(namespace, prefix, request, build):
+    """
+    一覧レスポンスのデータをキャッシュから取得する
+    キーはURL（ホスト・クエリパラメータを含む）から生成する
+    レスポンスはユーザーによって変わらないため、ユーザーIDはキーに含めない
+    """
+    digest = hashlib.md5(request.build_absolute_uri().encode()).hexdigest()
+    key = f'{namespace}:{prefix}:{_list_cache_version(namespace)}:{digest}'
+
+    data = cache.get(key)
+    if data is None:
+        data = build()
+        cache.set(key, data, LIST_CACHE_TIMEOUT)
+    return data
+
+
+def _bump_list_cache_version(namespace):
+    key = _version_key(namespace)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
+
+
+def invalidate_list_cache(namespace):
+    """
+    一覧のキャッシュを無効化
+    コミット前の内容が再びキャッシュされないよう、コミット後に世代番号を更新する
+    """
+    transaction.on_commit(lambda: _bump_list_cache_version(namespace))
+
+
+class CachedListMixin:
+    """
+    一覧レスポンスを短時間キャッシュするビューのMixin
+    モデルの更新時はシグナルからinvalidate_list_cache(list_cache_namespace)で無効化する
+    """
+    list_cache_namespace = None
+    list_cache_prefix = None
+
+    def list(self, request, *args, **kwargs):
+        return Response(get_cached_list_data(
+            self.list_cache_namespace, self.list_cache_prefix, request, self._build_list_data
+        ))
+
+    def _build_list_data(self):
+        """一覧のデータを生成（ListModelMixin.list()と同じ内容）"""
+        queryset = self.filter_queryset(self.get_queryset())
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data).data
+
+        return self.get_serializer(queryset, many=True).data
@@ -0,0 +1,108 @@
+# api/common/queries.py
+
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+
+@lru_cache(maxsize=None)
+def serializer_related_paths(serializer_class):
+    """
+    シリアライザーのsource（例: 'product.product_number'）から select_related 用のパスを取得
+    シリアライザーに関連先のフィールドを追加すると、クエリの結合も自動的に追加される
+    """
+    paths = set()
+    for field in serializer_class().fields.values():
+        parts = field.source.split('.')
+        if len(parts) > 1:
+            paths.add('__'.join(parts[:-1]))
+    return tuple(sorted(paths))
+
+
+def _concrete_field_names(model, prefix=''):
+    """モデルの全ての列のフィールド名を取得"""
+    return {
+        prefix + field.name
+        for field in model._meta.concrete_fields
+    }
+
+
+@lru_cache(maxsize=None)
+def serializer_only_fields(serializer_class):
+    """
+    シリアライザーのsourceから only() に指定する列を取得
+    注釈（annotate）による値は除外し、プロパティを参照する場合はそのモデルの全ての列を取得する
+    """
+    model = serializer_class.Meta.model
+    names = set()
+    for field in serializer_class().fields.values():
+        if field.source == '*':
+            continue
+        
+        current_model = model
+        prefix = ''
+        for name in field.source.split('.'):
+            try:
+                model_field = current_model._meta.get_field(name)
+            except FieldDoesNotExist:
+                # プロパティは依存する列が分からないため全ての列を取得（注釈は対象外）
+                if hasattr(current_model, name):
+                    names |= _concrete_field_names(current_model, prefix)
+                break
+            
+            if not model_field.concrete or model_field.many_to_many:
+                break
+            names.add(prefix + name)
+            if model_field.is_relation:
+                current_model = model_field.related_model
+                prefix += f'{name}__'
+    return tuple(sorted(names))
+
+
+@lru_cache(maxsize=None)
+def serializer_prefetch_paths(serializer_class):
+    """
+    ネストしたシリアライザー（many=True）から prefetch_related 用のパスを取得
+    ネスト先のシリアライザーが参照する関連先もパスに含める
+    モデルの関連ではないsource（Prefetchのto_attrなど）はビューで取得するため対象外
+    """
+    model = serializer_class.Meta.model
+    paths = set()
+    for field in serializer_class().fields.values():
+        if not isinstance(field, serializers.ListSerializer):
+            continue
+        if not isinstance(field.child, serializers.ModelSerializer):
+            continue
+        try:
+            model._meta.get_field(field.source.split('.')[0])
+        except FieldDoesNotExist:
+            continue
+        
+        prefix = field.source.replace('.', '__')
+        child_class = type(field.child)
+        paths.add(prefix)
+        paths.update(f'{prefix}__{path}' for path in serializer_related_paths(child_class))
+        paths.update(f'{prefix}__{path}' for path in serializer_prefetch_paths(child_class))
+    return tuple(sorted(paths))
+
+
+class AutoPrefetchMixin:
+    """
+    シリアライザーから select_related / prefetch_related を自動で付与するビューのMixin
+    ビューではquerysetと、シリアライザーから分からない取得（to_attrを指定したPrefetchなど）のみ記述する
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        
+        # 削除時はシリアライザーを使用しないため、関連の取得は行わない
+        if self.request.method == 'DELETE':
+            return queryset
+        
+        serializer_class = self.get_serializer_class()
+        return queryset.select_related(
+            *serializer_related_paths(serializer_class)
+        ).prefetch_related(
+            *serializer_prefetch_paths(serializer_class)
+        )
@@ -0,0 +1,55 @@
+# api/common/renderers.py
+
+import datetime
+
+import orjson
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+# orjsonが直接扱えない型（Decimal・遅延評価の文字列など）はDRFのエンコーダーで変換する
+_fallback_encoder = JSONEncoder()
+_datetime_field = serializers.DateTimeField()
+
+# 日時はorjsonで変換せずに_defaultで変換する（OPT_PASSTHROUGH_DATETIME）
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def _default(obj):
+    """
+    orjsonで変換しない値の変換
+    日時はDateTimeFieldと同じ形式（TIME_ZONEのオフセット付き）にし、
+    シリアライザー経由・values()の辞書のどちらでも同じ形式で出力する
+    """
+    if isinstance(obj, datetime.datetime):
+        return _datetime_field.to_representation(obj)
+    return _fallback_encoder.default(obj)
+
+
+def _dumps(data, option=0):
+    return orjson.dumps(data, default=_default, option=_ORJSON_OPTIONS | option)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """orjsonでJSONを出力するレンダラー（JSONRendererと同じメディアタイプ・形式）"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        # インデント指定（Acceptヘッダーのindent・ブラウザブルAPI）はorjsonが対応する2文字で出力する
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        return _dumps(data, orjson.OPT_INDENT_2 if indent else 0)
+
+
+def stream_json_array(rows):
+    """
+    行をJSON配列として少しずつ出力するジェネレーター（StreamingHttpResponse用）
+    全ての行をメモリに保持せずに出力できる
+    """
+    yield b'['
+    for index, row in enumerate(rows):
+        if index:
+            yield b','
+        yield _dumps(row)
+    yield b']'
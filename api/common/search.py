@@ -0,0 +1,48 @@
+# api/common/search.py
+
+from django.db import connection, models
+from django.db.models import Q
+from django.db.models.lookups import GreaterThan
+
+
+# MySQL ngramパーサーのトークン長（ngram_token_sizeの既定値）
+NGRAM_TOKEN_SIZE = 2
+
+
+class MatchAgainst(models.Func):
+    """
+    MySQLのFULLTEXTインデックスを使用した全文検索の関連度（MATCH ... AGAINST）
+    一致しない行は0になるため、条件として使う場合は0より大きいかで判定する
+    """
+    function = 'MATCH'
+    template = '%(function)s (%(expressions)s) AGAINST (%%s IN BOOLEAN MODE)'
+    output_field = models.FloatField()
+
+    def __init__(self, *expressions, query):
+        super().__init__(*expressions)
+        # フレーズ検索として扱い、部分一致（icontains）と同等の結果にする
+        self.query = '"{}"'.format(query.replace('"', ' '))
+
+    def as_sql(self, compiler, connection, **extra_context):
+        sql, params = super().as_sql(compiler, connection, **extra_context)
+        return sql, (*params, self.query)
+
+
+def fulltext_filter(fields, search):
+    """
+    全文検索の条件を作成する
+    MySQL以外、または検索語がngramのトークン長に満たない場合はicontainsで検索する
+
+    NOTE: FULLTEXTインデックスはストップワードを無効にして作成する
+    （innodb_ft_enable_stopword=OFF、各アプリのFULLTEXTインデックスの再作成マイグレーションを参照）
+    ngramパーサーは既定のストップワード（a, i, theなど）を含むトークンを索引しないため、
+    有効なままでは「ai」などを含む語がicontainsでは一致してもFULLTEXTでは一致しない
+    """
+    if connection.vendor == 'mysql' and len(search.strip()) >= NGRAM_TOKEN_SIZE:
+        # Func単体の条件はMySQLでは「= True」と比較されるため、関連度 > 0 の比較にする
+        return Q(GreaterThan(MatchAgainst(*fields, query=search), 0))
+
+    condition = Q()
+    for field in fields:
+        condition |= Q(**{f'{field}__icontains': search})
+    return condition
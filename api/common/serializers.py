@@ -0,0 +1,45 @@
+# api/common/serializers.py
+
+import re
+
+from django.db import IntegrityError, transaction
+from rest_framework import serializers
+
+
+# MySQLの一意制約違反メッセージからインデックス名を取り出す
+# 例: Duplicate entry 'SUP001' for key 'suppliers.supplier_code'
+DUPLICATE_KEY_PATTERN = re.compile(r"for key '(?:[^']*\.)?([^']+)'")
+
+
+class UniqueConstraintErrorMixin:
+    """
+    一意制約違反（IntegrityError）を項目ごとのValidationErrorに変換する
+    事前のexists()による重複チェックの代わりにDBの一意制約で判定する
+    """
+    # {インデックス名に含まれる文字列: (項目名, エラーメッセージ)}
+    unique_error_messages = {}
+
+    def create(self, validated_data):
+        try:
+            # 違反時もリクエスト全体のトランザクションを継続できるようセーブポイントを作成
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError as e:
+            self._raise_unique_error(e)
+
+    def update(self, instance, validated_data):
+        try:
+            with transaction.atomic():
+                return super().update(instance, validated_data)
+        except IntegrityError as e:
+            self._raise_unique_error(e)
+
+    def _raise_unique_error(self, error):
+        """違反したインデックスに対応する項目のエラーとして送出（該当なしは再送出）"""
+        match = DUPLICATE_KEY_PATTERN.search(str(error))
+        if match:
+            index_name = match.group(1)
+            for key, (field, message) in self.unique_error_messages.items():
+                if key in index_name:
+                    raise serializers.ValidationError({field: message}) from error
+        raise error
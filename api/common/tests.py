@@ -0,0 +1,124 @@
+# api/common/tests.py
+
+import json
+from datetime import datetime, timezone as dt_timezone
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import models
+from django.test import RequestFactory, TestCase
+
+from api.common.cache import get_cached_list_data, invalidate_list_cache
+from api.common.renderers import ORJSONRenderer, stream_json_array
+from api.common.search import MatchAgainst, fulltext_filter
+from api.supplier.models import Supplier
+
+
+class FulltextFilterTests(TestCase):
+    """全文検索の条件（fulltext_filter）のテスト"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.supplier = Supplier.objects.create(supplier_code='SUP001', company_name='Main Trading')
+        Supplier.objects.create(supplier_code='SUP002', company_name='株式会社ABC')
+
+    def test_icontains_fallback(self):
+        # MySQL以外ではicontainsで検索する（ストップワードを含む語も一致する）
+        queryset = Supplier.objects.filter(
+            fulltext_filter(['supplier_code', 'company_name'], 'ai')
+        )
+        self.assertQuerySetEqual(queryset, [self.supplier])
+
+    def test_match_against_compared_with_zero(self):
+        with mock.patch('api.common.search.connection') as connection:
+            connection.vendor = 'mysql'
+            condition = fulltext_filter(['supplier_code', 'company_name'], 'trading')
+
+        sql = str(Supplier.objects.filter(condition).query)
+        self.assertIn('AGAINST', sql)
+        # 関連度を0と比較する（「= True」との比較では関連度が1の行しか一致しない）
+        self.assertIn(') > 0', sql)
+        self.assertNotIn('= True', sql)
+
+    def test_short_search_uses_icontains_on_mysql(self):
+        with mock.patch('api.common.search.connection') as connection:
+            connection.vendor = 'mysql'
+            condition = fulltext_filter(['supplier_code', 'company_name'], 'A')
+
+        self.assertNotIn('AGAINST', str(Supplier.objects.filter(condition).query))
+
+    def test_match_against_is_relevance(self):
+        expression = MatchAgainst('company_name', query='ABC')
+        self.assertIsInstance(expression.output_field, models.FloatField)
+        self.assertEqual(expression.query, '"ABC"')
+
+
+class ListCacheTests(TestCase):
+    """一覧キャッシュ（世代番号による無効化）のテスト"""
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.build = mock.Mock(side_effect=lambda: {'count': self.build.call_count})
+
+    def get(self, path='/api/parts/'):
+        return get_cached_list_data('parts', 'list', self.factory.get(path), self.build)
+
+    def test_cached_until_invalidated(self):
+        self.assertEqual(self.get(), {'count': 1})
+        self.assertEqual(self.get(), {'count': 1})
+        self.assertEqual(self.build.call_count, 1)
+
+    def test_key_includes_query_params(self):
+        self.get('/api/parts/?page=1')
+        self.get('/api/parts/?page=2')
+        self.assertEqual(self.build.call_count, 2)
+
+    def test_invalidated_after_commit(self):
+        self.get()
+        with self.captureOnCommitCallbacks() as callbacks:
+            invalidate_list_cache('parts')
+            # コミット前は無効化しない（コミット前の内容が再びキャッシュされるのを防ぐ）
+            self.assertEqual(self.get(), {'count': 1})
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(self.get(), {'count': 2})
+
+    def test_other_namespace_not_invalidated(self):
+        self.get()
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_list_cache('supplier')
+        self.get()
+        self.assertEqual(self.build.call_count, 1)
+
+
+class ORJSONRendererTests(TestCase):
+    """orjsonによるJSON出力のテスト"""
+
+    renderer = ORJSONRenderer()
+
+    def test_compact_by_default(self):
+        self.assertEqual(self.renderer.render({'a': 1}), b'{"a":1}')
+
+    def test_indent_from_renderer_context(self):
+        # ブラウザブルAPIはrenderer_contextでインデントを指定する
+        output = self.renderer.render({'a': 1}, renderer_context={'indent': 4})
+        self.assertEqual(output, b'{\n  "a": 1\n}')
+
+    def test_indent_from_media_type(self):
+        output = self.renderer.render({'a': 1}, accepted_media_type='application/json; indent=4')
+        self.assertEqual(output, b'{\n  "a": 1\n}')
+
+    def test_datetime_in_current_timezone(self):
+        # values()の辞書の日時（UTC）もDateTimeFieldと同じTIME_ZONEのオフセット付きで出力する
+        value = datetime(2026, 1, 1, 0, 0, tzinfo=dt_timezone.utc)
+        self.assertEqual(
+            json.loads(self.renderer.render({'created_at': value})),
+            {'created_at': '2026-01-01T09:00:00+09:00'}
+        )
+
+    def test_stream_json_array(self):
+        rows = [{'id': 1}, {'id': 2}]
+        self.assertEqual(json.loads(b''.join(stream_json_array(rows))), rows)
+        self.assertEqual(b''.join(stream_json_array([])), b'[]')
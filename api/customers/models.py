@@ -1,6 +1,5 @@
 # api/customers/models.py
 
-from pyexpat import model
 from django.db import models
 from django.core.validators import RegexValidator
 from django.core.exceptions import ValidationError
@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models import Count, Q
 from api.products.models import Product
 
 
@@ -13,12 +14,17 @@ class ProductAdmin(admin.ModelAdmin):
     
     list_filter = ['status', 'created_at', 'updated_at']
     
+    list_select_related = ['created_by']
+    
     search_fields = [
         'product_number', 'product_name', 'description'
     ]
     
     readonly_fields = ['created_at', 'updated_at', 'parts_count']
     
+    # ユーザー全件をプルダウンに読み込まないようにする
+    raw_id_fields = ['created_by']
+    
     fieldsets = (
         ('基本情報', {
             'fields': ('product_number', 'product_name', 'description')
@@ -32,10 +38,17 @@ class ProductAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        """最適化されたクエリセット（部品数を集計）"""
+        return super().get_queryset(request).annotate(
+            _parts_count=Count('parts', filter=Q(parts__is_active=True))
+        )
+    
     def parts_count(self, obj):
         """紐づく部品数"""
-        return obj.parts.filter(is_active=True).count()
+        return obj._parts_count
     parts_count.short_description = '部品数'
+    parts_count.admin_order_field = '_parts_count'
     
     def save_model(self, request, obj, form, change):
         """保存時に作成者を設定"""
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.7 on 2026-10-15 10:41
+
+from django.db import migrations
+
+
+def create_fulltext_index(apps, schema_editor):
+    """製品検索用のFULLTEXTインデックスを作成（MySQLのみ）"""
+    if schema_editor.connection.vendor != "mysql":
+        return
+    schema_editor.execute(
+        "CREATE FULLTEXT INDEX products_search_ft "
+        "ON products (product_number, product_name, description) WITH PARSER ngram"
+    )
+
+
+def drop_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "mysql":
+        return
+    schema_editor.execute("DROP INDEX products_search_ft ON products")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fulltext_index, drop_fulltext_index),
+    ]
@@ -67,6 +67,7 @@ class Product(models.Model):
             models.Index(fields=['status']),
             models.Index(fields=['created_at']),
         ]
+        # 検索用のFULLTEXTインデックス（products_search_ft）はマイグレーション0002で作成
 
     def __str__(self):
         return f'{self.product_number} - {self.product_name}'
@@ -2,6 +2,7 @@
 
 from rest_framework import serializers
 from api.products.models import Product
+from api.purchases.serializers import PartListSerializer
 
 
 class ProductListSerializer(serializers.ModelSerializer):
@@ -31,8 +32,8 @@ class ProductDetailSerializer(serializers.ModelSerializer):
         default=None
     )
     
-    # 紐づく部品の情報
-    parts = serializers.SerializerMethodField()
+    # 紐づく有効な部品の情報（ビューで有効な部品のみをPrefetch(to_attr='_active_parts')で取得する）
+    parts = PartListSerializer(source='_active_parts', many=True, read_only=True)
 
     class Meta:
         model = Product
@@ -43,12 +44,6 @@ class ProductDetailSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at', 'created_by']
 
-    def get_parts(self, obj):
-        """関連する部品情報を取得"""
-        from api.purchases.serializers import PartListSerializer
-        parts = obj.active_parts
-        return PartListSerializer(parts, many=True).data
-
 
 class ProductCreateUpdateSerializer(serializers.ModelSerializer):
     """製品作成・更新用のシリアライザー"""
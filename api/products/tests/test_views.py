@@ -0,0 +1,55 @@
+# api/products/tests/test_views.py
+
+from datetime import date
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from api.accounts.models import User
+from api.products.models import Product
+from api.purchases.models import Part, PriceHistory
+from api.supplier.models import Supplier, SupplierBranch
+
+
+class ProductDetailViewTests(TestCase):
+    """製品詳細（有効な部品を含む）のテスト"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('user1', 'user1@example.com', 'password')
+        supplier = Supplier.objects.create(supplier_code='SUP001', company_name='株式会社ABC')
+        branch = SupplierBranch.objects.create(
+            supplier=supplier, branch_code='SUP001-HQ', branch_name='本社'
+        )
+        cls.product = Product.objects.create(product_number='P001', product_name='製品A')
+        for number in range(3):
+            part = Part.objects.create(
+                product=cls.product, supplier_branch=branch,
+                part_number=f'PT00{number}', part_name=f'部品{number}'
+            )
+            PriceHistory.objects.create(part=part, price=100 + number, start_date=date(2020, 1, 1))
+        Part.objects.create(
+            product=cls.product, supplier_branch=branch,
+            part_number='PT999', part_name='廃止部品', is_active=False
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_active_parts_with_current_price(self):
+        response = self.client.get(f'/api/products/{self.product.pk}/')
+        self.assertEqual(response.status_code, 200)
+
+        data = response.json()
+        self.assertEqual(data['parts_count'], 3)
+        self.assertEqual([part['part_number'] for part in data['parts']], ['PT000', 'PT001', 'PT002'])
+        self.assertEqual(
+            [part['current_price'] for part in data['parts']], ['100.00', '101.00', '102.00']
+        )
+
+    def test_parts_fetched_in_one_query(self):
+        # 製品・部品（製品・仕入先を結合）の2クエリ（部品数によらない）
+        # ＋ATOMIC_REQUESTSのセーブポイントの作成・解放
+        with self.assertNumQueries(4):
+            self.client.get(f'/api/products/{self.product.pk}/')
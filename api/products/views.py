@@ -2,9 +2,11 @@
 
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
-from django.db.models import Count, Q
+from django.db.models import Count, Q, Prefetch
 
+from api.common.search import fulltext_filter
 from api.products.models import Product
+from api.purchases.models import Part
 from api.products.serializers import (
     ProductListSerializer,
     ProductDetailSerializer,
@@ -26,6 +28,11 @@ class IsAdminUser(permissions.BasePermission):
 class ProductListCreateView(generics.ListCreateAPIView):
     """製品一覧取得・作成ビュー"""
     permission_classes = [permissions.IsAuthenticated]
+    serializer_class = ProductListSerializer
+    # HTTPメソッドごとのシリアライザー（未定義のメソッドはserializer_classを使用）
+    serializer_classes = {
+        'POST': ProductCreateUpdateSerializer,
+    }
     
     def get_queryset(self):
         """クエリセットを取得（部品数も含む）"""
@@ -40,18 +47,15 @@ class ProductListCreateView(generics.ListCreateAPIView):
         
         search = self.request.query_params.get('search', None)
         if search:
+            # FULLTEXTインデックス（products_search_ft）を使用して検索
             queryset = queryset.filter(
-                Q(product_number__icontains=search) |
-                Q(product_name__icontains=search) |
-                Q(description__icontains=search)
+                fulltext_filter(['product_number', 'product_name', 'description'], search)
             )
         
         return queryset.order_by('-created_at')
 
     def get_serializer_class(self):
-        if self.request.method == 'POST':
-            return ProductCreateUpdateSerializer
-        return ProductListSerializer
+        return self.serializer_classes.get(self.request.method, self.serializer_class)
 
     def perform_create(self, serializer):
         """製品作成時に作成者を設定"""
@@ -62,17 +66,34 @@ class ProductDetailView(generics.RetrieveUpdateDestroyAPIView):
     """製品詳細取得・更新・削除ビュー"""
     permission_classes = [permissions.IsAuthenticated]
     lookup_field = 'pk'
+    serializer_class = ProductDetailSerializer
+    # HTTPメソッドごとのシリアライザー（未定義のメソッドはserializer_classを使用）
+    serializer_classes = {
+        'PUT': ProductCreateUpdateSerializer,
+        'PATCH': ProductCreateUpdateSerializer,
+    }
 
     def get_queryset(self):
         """クエリセットを取得"""
-        return Product.objects.annotate(
+        queryset = Product.objects.annotate(
             parts_count=Count('parts', filter=Q(parts__is_active=True))
-        ).select_related('created_by').prefetch_related('parts__supplier_branch__supplier')
+        ).select_related('created_by')
+        
+        # 削除時は部品数（parts_count）のみ使用するため、部品の取得は行わない
+        if self.request.method == 'DELETE':
+            return queryset
+        
+        # 有効な部品のみをまとめて取得（PartListSerializerで使用する列のみ）
+        active_parts_prefetch = Prefetch(
+            'parts',
+            queryset=Part.objects.filter(is_active=True).with_list_joins(),
+            to_attr='_active_parts'
+        )
+        
+        return queryset.prefetch_related(active_parts_prefetch)
 
     def get_serializer_class(self):
-        if self.request.method in ['PUT', 'PATCH']:
-            return ProductCreateUpdateSerializer
-        return ProductDetailSerializer
+        return self.serializer_classes.get(self.request.method, self.serializer_class)
 
     def destroy(self, request, *args, **kwargs):
         """製品の削除（管理者のみ）"""
@@ -84,8 +105,8 @@ class ProductDetailView(generics.RetrieveUpdateDestroyAPIView):
         
         instance = self.get_object()
         
-        # 紐づく部品が存在するかチェック
-        if instance.parts.filter(is_active=True).exists():
+        # 紐づく部品が存在するかチェック（get_querysetで付与した部品数を使用）
+        if instance.parts_count > 0:
             return Response(
                 {"error": "有効な部品が紐づいているため削除できません"},
                 status=status.HTTP_400_BAD_REQUEST
@@ -22,7 +22,7 @@ class PartAdmin(admin.ModelAdmin):
     ]
     
     list_filter = [
-        'is_active', 'unit', 'product', 'supplier_branch__supplier',
+        'is_active', 'unit', 'product', 'supplier',
         'created_at'
     ]
     
@@ -30,7 +30,7 @@ class PartAdmin(admin.ModelAdmin):
         'part_number', 'part_name', 'specification',
         'product__product_number', 'product__product_name',
         'supplier_branch__branch_name',
-        'supplier_branch__supplier__company_name'
+        'supplier__company_name'
     ]
     
     readonly_fields = [
@@ -72,22 +72,20 @@ class PartAdmin(admin.ModelAdmin):
     
     def get_queryset(self, request):
         """最適化されたクエリセット"""
-        return super().get_queryset(request).select_related(
-            'product',
-            'supplier_branch__supplier',
-            'created_by'
-        ).prefetch_related('price_histories')
+        return super().get_queryset(request).with_details()
     
     def current_price(self, obj):
         """現在の価格"""
-        price = obj.current_price
+        price = getattr(obj, 'current_price', None)
         return f"¥{price:,.2f}" if price else "-"
     current_price.short_description = '現在単価'
+    current_price.admin_order_field = 'current_price'
     
-    def price_history_count(self, obj):
-        """価格履歴の件数"""
-        return obj.price_history_count
-    price_history_count.short_description = '価格履歴数'
+    def has_multiple_active_prices(self, obj):
+        """複数の有効な価格が存在するか"""
+        return getattr(obj, 'has_multiple_active_prices', False)
+    has_multiple_active_prices.short_description = '複数の有効価格'
+    has_multiple_active_prices.boolean = True
     
     def save_model(self, request, obj, form, change):
         """保存時に作成者を設定"""
@@ -167,11 +165,25 @@ class PriceHistoryAdmin(admin.ModelAdmin):
     
     def get_queryset(self, request):
         """最適化されたクエリセット"""
-        return super().get_queryset(request).select_related(
-            'part__product',
-            'part__supplier_branch__supplier',
-            'created_by'
-        )
+        return super().get_queryset(request).with_details()
+    
+    def is_current(self, obj):
+        """現在有効な価格かどうか"""
+        return getattr(obj, 'is_current', False)
+    is_current.short_description = '現在有効'
+    is_current.boolean = True
+    
+    def is_future(self, obj):
+        """将来の価格かどうか"""
+        return getattr(obj, 'is_future', False)
+    is_future.short_description = '将来'
+    is_future.boolean = True
+    
+    def is_expired(self, obj):
+        """期限切れかどうか"""
+        return getattr(obj, 'is_expired', False)
+    is_expired.short_description = '期限切れ'
+    is_expired.boolean = True
     
     def save_model(self, request, obj, form, change):
         """保存時に作成者を設定"""
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class PurchasesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "api.purchases"
+
+    def ready(self):
+        import api.purchases.signals  # noqa: F401
@@ -0,0 +1,45 @@
+# api/purchases/filters.py
+
+from django_filters import rest_framework as filters
+
+from api.purchases.models import Part, PriceHistory
+
+
+class PartFilter(filters.FilterSet):
+    """部品一覧のフィルタ"""
+    product = filters.NumberFilter(field_name='product_id')
+    supplier = filters.NumberFilter(field_name='supplier_id')
+    branch = filters.NumberFilter(field_name='supplier_branch_id')
+    is_active = filters.BooleanFilter()
+    search = filters.CharFilter(method='filter_search')
+
+    class Meta:
+        model = Part
+        fields = ['product', 'supplier', 'branch', 'is_active', 'search']
+
+    def filter_search(self, queryset, name, value):
+        """品番・部品名・製品・仕入先で検索"""
+        return queryset.search(value)
+
+
+class PriceHistoryFilter(filters.FilterSet):
+    """価格履歴一覧のフィルタ"""
+    STATUS_CHOICES = [
+        ('current', '現在有効'),
+        ('future', '将来'),
+        ('expired', '期限切れ'),
+    ]
+
+    part = filters.NumberFilter(field_name='part_id')
+    product = filters.NumberFilter(field_name='part__product_id')
+    is_active = filters.BooleanFilter()
+    # 有効期間フィルタ
+    status = filters.ChoiceFilter(choices=STATUS_CHOICES, method='filter_status')
+
+    class Meta:
+        model = PriceHistory
+        fields = ['part', 'product', 'is_active', 'status']
+
+    def filter_status(self, queryset, name, value):
+        """有効期間で絞り込み（current / future / expired）"""
+        return getattr(queryset, value)()
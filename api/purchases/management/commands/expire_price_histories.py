@@ -0,0 +1,24 @@
+# api/purchases/management/commands/expire_price_histories.py
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from api.common.cache import invalidate_list_cache
+from api.purchases.models import PriceHistory
+
+
+class Command(BaseCommand):
+    """終了日を過ぎた価格履歴を一括で無効化するコマンド（cron等で日次実行）"""
+    help = "終了日を過ぎた有効な価格履歴を無効化します"
+
+    def handle(self, *args, **options):
+        today = timezone.localdate()
+        count = PriceHistory.objects.filter(
+            end_date__lt=today,
+            is_active=True
+        ).update(is_active=False, updated_at=timezone.now())
+        if count:
+            # update()ではシグナルが送られないため、一覧キャッシュを明示的に無効化
+            invalidate_list_cache('purchases')
+        
+        self.stdout.write(self.style.SUCCESS(f"{count}件の価格履歴を無効化しました"))
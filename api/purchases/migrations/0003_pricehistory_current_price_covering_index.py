@@ -0,0 +1,24 @@
+# Generated by Django 5.2.7 on 2026-10-15 11:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("purchases", "0002_alter_part_lead_time_days_alter_part_unit_and_more"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="pricehistory",
+            name="price_histo_part_id_9d6b7a_idx",
+        ),
+        migrations.AddIndex(
+            model_name="pricehistory",
+            index=models.Index(
+                fields=["part", "is_active", "-start_date", "price", "end_date"],
+                name="price_histo_part_id_58fcb2_idx",
+            ),
+        ),
+    ]
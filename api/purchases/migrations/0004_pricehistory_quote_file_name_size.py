@@ -0,0 +1,52 @@
+# Generated by Django 5.2.7 on 2026-10-15 12:05
+
+import os
+
+from django.db import migrations, models
+
+
+def fill_quote_file_info(apps, schema_editor):
+    """既存の見積書ファイルのファイル名・サイズを保存"""
+    PriceHistory = apps.get_model("purchases", "PriceHistory")
+    histories = PriceHistory.objects.exclude(quote_file="").exclude(
+        quote_file__isnull=True
+    )
+    for history in histories.iterator():
+        history.quote_file_name = os.path.basename(history.quote_file.name)
+        try:
+            history.quote_file_size = history.quote_file.size
+        except OSError:
+            history.quote_file_size = None
+        history.save(update_fields=["quote_file_name", "quote_file_size"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("purchases", "0003_pricehistory_current_price_covering_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="pricehistory",
+            name="quote_file_name",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                max_length=255,
+                verbose_name="見積書ファイル名",
+            ),
+        ),
+        migrations.AddField(
+            model_name="pricehistory",
+            name="quote_file_size",
+            field=models.PositiveBigIntegerField(
+                blank=True,
+                editable=False,
+                help_text="アップロード時に保存したファイルサイズ（バイト）",
+                null=True,
+                verbose_name="見積書ファイルサイズ",
+            ),
+        ),
+        migrations.RunPython(fill_quote_file_info, migrations.RunPython.noop),
+    ]
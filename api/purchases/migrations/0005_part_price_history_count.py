@@ -0,0 +1,41 @@
+# Generated by Django 5.2.7 on 2026-10-15 13:10
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def fill_price_history_count(apps, schema_editor):
+    """既存の部品の価格履歴数を集計して保存"""
+    Part = apps.get_model("purchases", "Part")
+    PriceHistory = apps.get_model("purchases", "PriceHistory")
+    price_history_count = (
+        PriceHistory.objects.filter(part=models.OuterRef("pk"))
+        .order_by()
+        .values("part")
+        .annotate(count=models.Count("pk"))
+        .values("count")
+    )
+    Part.objects.update(
+        price_history_count=Coalesce(
+            models.Subquery(price_history_count, output_field=models.IntegerField()),
+            0,
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("purchases", "0004_pricehistory_quote_file_name_size"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="part",
+            name="price_history_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="価格履歴数"
+            ),
+        ),
+        migrations.RunPython(fill_price_history_count, migrations.RunPython.noop),
+    ]
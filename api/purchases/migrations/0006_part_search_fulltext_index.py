@@ -0,0 +1,30 @@
+# Generated by Django 5.2.7 on 2026-10-15 13:42
+
+from django.db import migrations
+
+
+def create_fulltext_index(apps, schema_editor):
+    """部品検索用のFULLTEXTインデックスを作成（MySQLのみ）"""
+    if schema_editor.connection.vendor != "mysql":
+        return
+    schema_editor.execute(
+        "CREATE FULLTEXT INDEX parts_search_ft "
+        "ON parts (part_number, part_name) WITH PARSER ngram"
+    )
+
+
+def drop_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "mysql":
+        return
+    schema_editor.execute("DROP INDEX parts_search_ft ON parts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("purchases", "0005_part_price_history_count"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fulltext_index, drop_fulltext_index),
+    ]
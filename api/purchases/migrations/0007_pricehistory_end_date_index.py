@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-15 14:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("purchases", "0006_part_search_fulltext_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="pricehistory",
+            index=models.Index(fields=["end_date"], name="price_histo_end_dat_3666e4_idx"),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.7 on 2026-10-15 14:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def fill_part_supplier(apps, schema_editor):
+    """既存の部品に仕入先支店の仕入先を設定"""
+    Part = apps.get_model("purchases", "Part")
+    SupplierBranch = apps.get_model("supplier", "SupplierBranch")
+    Part.objects.update(
+        supplier_id=models.Subquery(
+            SupplierBranch.objects.filter(
+                pk=models.OuterRef("supplier_branch_id")
+            ).values("supplier_id")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("purchases", "0007_pricehistory_end_date_index"),
+        ("supplier", "0002_alter_supplier_company_name_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="part",
+            name="supplier",
+            field=models.ForeignKey(
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="supplier.supplier",
+                verbose_name="仕入先",
+            ),
+        ),
+        migrations.RunPython(fill_part_supplier, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="part",
+            name="supplier",
+            field=models.ForeignKey(
+                editable=False,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="supplier.supplier",
+                verbose_name="仕入先",
+            ),
+        ),
+    ]
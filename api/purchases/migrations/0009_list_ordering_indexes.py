@@ -0,0 +1,54 @@
+# Generated by Django 5.2.7 on 2026-10-15 15:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("purchases", "0008_part_supplier"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="part",
+            index=models.Index(
+                fields=["product", "part_number"], name="parts_product_52e89c_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="part",
+            index=models.Index(
+                fields=["supplier_branch", "part_number"], name="parts_supplie_2eed83_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="part",
+            index=models.Index(
+                fields=["supplier", "part_number"], name="parts_supplie_71178f_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="part",
+            index=models.Index(
+                fields=["is_active", "part_number"], name="parts_is_acti_471722_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="pricehistory",
+            index=models.Index(
+                fields=["part", "-start_date", "-created_at"],
+                name="price_histo_part_id_ccdb11_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="pricehistory",
+            index=models.Index(
+                fields=["-start_date", "-created_at"], name="price_histo_start_d_43a5a1_idx"
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name="pricehistory",
+            name="price_histo_part_id_e309bb_idx",
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.7 on 2026-10-16 10:20
+
+from django.db import migrations, models
+
+
+def empty_to_null(apps, schema_editor):
+    """見積書ファイルがない価格履歴のファイル名を空文字からNULLに変更"""
+    PriceHistory = apps.get_model("purchases", "PriceHistory")
+    PriceHistory.objects.filter(quote_file_name="").update(quote_file_name=None)
+
+
+def null_to_empty(apps, schema_editor):
+    PriceHistory = apps.get_model("purchases", "PriceHistory")
+    PriceHistory.objects.filter(quote_file_name__isnull=True).update(quote_file_name="")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("purchases", "0010_part_search_fulltext_index_without_stopwords"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="pricehistory",
+            name="quote_file_name",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                max_length=255,
+                null=True,
+                verbose_name="見積書ファイル名",
+            ),
+        ),
+        migrations.RunPython(empty_to_null, null_to_empty),
+    ]
@@ -5,8 +5,143 @@ from django.db import models
 from django.core.validators import MinValueValidator
 from django.core.exceptions import ValidationError
 from django.utils import timezone
+from django.utils.text import get_valid_filename
 from decimal import Decimal
 
+from api.common.queries import serializer_only_fields, serializer_related_paths
+from api.common.search import fulltext_filter
+
+
+class PartQuerySet(models.QuerySet):
+    """部品クエリセット"""
+
+    def search(self, search):
+        """
+        品番・部品名・製品・仕入先で検索
+        品番・部品名はFULLTEXTインデックス（parts_search_ft）を使用する
+        製品・仕入先の条件はEXISTSサブクエリにし、検索のためのJOINを行わない
+        """
+        Product = self.model._meta.get_field('product').related_model
+        Supplier = self.model._meta.get_field('supplier').related_model
+
+        return self.filter(
+            fulltext_filter(['part_number', 'part_name'], search) |
+            models.Exists(Product.objects.filter(
+                models.Q(product_number__icontains=search) |
+                models.Q(product_name__icontains=search),
+                pk=models.OuterRef('product_id'),
+            )) |
+            models.Exists(Supplier.objects.filter(
+                pk=models.OuterRef('supplier_id'),
+                company_name__icontains=search,
+            ))
+        )
+
+    def with_list_joins(self):
+        """一覧（PartListSerializer）で使用する結合・注釈を付与"""
+        from api.purchases.serializers import PartListSerializer
+        return self.select_related(
+            *serializer_related_paths(PartListSerializer)
+        ).only(
+            *serializer_only_fields(PartListSerializer)
+        ).with_current_price()
+
+    def with_detail_joins(self):
+        """詳細（PartDetailSerializer）で使用する結合・注釈・価格履歴を付与"""
+        from api.purchases.serializers import PartDetailSerializer
+        price_histories_prefetch = models.Prefetch(
+            'price_histories',
+            queryset=PriceHistory.objects.with_list_joins().order_by('-start_date', '-created_at')
+        )
+        return self.select_related(
+            *serializer_related_paths(PartDetailSerializer)
+        ).with_current_price().with_has_multiple_active_prices().prefetch_related(
+            price_histories_prefetch
+        )
+
+    def with_details(self):
+        """詳細表示用の関連・集計をまとめて付与（管理画面用）"""
+        return self.select_related(
+            'product',
+            'supplier_branch__supplier',
+            'created_by'
+        ).with_current_price().with_has_multiple_active_prices()
+
+    def with_current_price(self):
+        """現在の有効な価格（最新の1件）をサブクエリで付与"""
+        current_price = PriceHistory.objects.filter(
+            part=models.OuterRef('pk'),
+            is_active=True,
+            start_date__lte=timezone.localdate()
+        ).order_by('-start_date').values('price')[:1]
+        return self.annotate(current_price=models.Subquery(current_price))
+
+    def with_has_multiple_active_prices(self):
+        """現在有効な価格が複数存在するかを付与（2件目の有無のみを確認する）"""
+        today = timezone.localdate()
+        second_price = PriceHistory.objects.filter(
+            part=models.OuterRef('pk'),
+            is_active=True,
+            start_date__lte=today
+        ).filter(
+            models.Q(end_date__isnull=True) | models.Q(end_date__gte=today)
+        ).values('pk')[1:2]
+        return self.annotate(has_multiple_active_prices=models.Exists(second_price))
+
+
+class PriceHistoryQuerySet(models.QuerySet):
+    """価格履歴クエリセット"""
+
+    def with_list_joins(self):
+        """一覧（PriceHistoryListSerializer）で使用する結合・状態を付与"""
+        from api.purchases.serializers import PriceHistoryListSerializer
+        # 部品ごとの価格履歴の取得（prefetch）でも使用するため部品IDも取得する
+        return self.select_related(
+            *serializer_related_paths(PriceHistoryListSerializer)
+        ).only(
+            'part', *serializer_only_fields(PriceHistoryListSerializer)
+        ).with_status()
+
+    def with_details(self):
+        """表示用の関連・状態をまとめて付与（管理画面・APIで共通）"""
+        return self.select_related(
+            'part__product',
+            'part__supplier_branch__supplier',
+            'created_by'
+        ).with_status()
+
+    @staticmethod
+    def _status_conditions(today):
+        """現在有効・将来・期限切れの条件（フィルタと注釈で共通）"""
+        return {
+            'is_current': (
+                models.Q(is_active=True, start_date__lte=today) &
+                (models.Q(end_date__isnull=True) | models.Q(end_date__gte=today))
+            ),
+            'is_future': models.Q(start_date__gt=today),
+            'is_expired': models.Q(end_date__isnull=False, end_date__lt=today),
+        }
+
+    def with_status(self):
+        """現在有効・将来・期限切れの判定をSQLで付与"""
+        conditions = self._status_conditions(timezone.localdate())
+        return self.annotate(**{
+            name: models.ExpressionWrapper(condition, output_field=models.BooleanField())
+            for name, condition in conditions.items()
+        })
+
+    def current(self):
+        """現在有効な価格のみ"""
+        return self.filter(self._status_conditions(timezone.localdate())['is_current'])
+
+    def future(self):
+        """将来の価格のみ"""
+        return self.filter(self._status_conditions(timezone.localdate())['is_future'])
+
+    def expired(self):
+        """期限切れの価格のみ"""
+        return self.filter(self._status_conditions(timezone.localdate())['is_expired'])
+
 
 class Part(models.Model):
     """部品モデル"""
@@ -26,6 +161,14 @@ class Part(models.Model):
         verbose_name="仕入先支店",
         help_text="この部品を供給する仕入先支店"
     )
+    # 仕入先支店の仕入先（絞り込み・表示で支店を経由しないように保持）
+    supplier = models.ForeignKey(
+        'supplier.Supplier',
+        on_delete=models.PROTECT,
+        related_name='+',
+        editable=False,
+        verbose_name="仕入先"
+    )
     
     # 基本情報
     part_number = models.CharField(
@@ -80,6 +223,13 @@ class Part(models.Model):
         verbose_name="備考"
     )
     
+    # 価格履歴の件数（api/purchases/signals.py で価格履歴の追加・削除時に更新）
+    price_history_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name="価格履歴数"
+    )
+    
     # タイムスタンプ
     created_at = models.DateTimeField(
         auto_now_add=True,
@@ -98,6 +248,8 @@ class Part(models.Model):
         verbose_name="作成者"
     )
     
+    objects = PartQuerySet.as_manager()
+    
     class Meta:
         verbose_name = "部品"
         verbose_name_plural = "部品一覧"
@@ -109,69 +261,49 @@ class Part(models.Model):
             models.Index(fields=['product', 'is_active']),
             models.Index(fields=['supplier_branch', 'is_active']),
             models.Index(fields=['created_at']),
+            # 一覧の絞り込み + 品番順の並び替え用
+            models.Index(fields=['product', 'part_number']),
+            models.Index(fields=['supplier_branch', 'part_number']),
+            models.Index(fields=['supplier', 'part_number']),
+            models.Index(fields=['is_active', 'part_number']),
         ]
+        # 検索用のFULLTEXTインデックス（parts_search_ft）はマイグレーション0006で作成
     
     def __str__(self):
         return f"{self.part_number} - {self.part_name}"
     
-    def clean(self):
-        """バリデーション"""
-        super().clean()
-        
-        # 同じ製品と仕入先の組み合わせで同じ品番が存在しないかチェック
-        if self.pk:
-            existing = Part.objects.filter(
-                product=self.product,
-                supplier_branch=self.supplier_branch,
-                part_number=self.part_number
-            ).exclude(pk=self.pk)
-        else:
-            existing = Part.objects.filter(
-                product=self.product,
-                supplier_branch=self.supplier_branch,
-                part_number=self.part_number
-            )
+    def save(self, *args, **kwargs):
+        """保存時の処理"""
+        # 仕入先支店から仕入先を設定
+        if self.supplier_branch_id:
+            self.supplier_id = self.supplier_branch.supplier_id
         
-        if existing.exists():
-            raise ValidationError(
-                "この製品と仕入先の組み合わせで、同じ品番が既に登録されています。"
-            )
+        super().save(*args, **kwargs)
     
-    @property
-    def current_price(self):
-        """現在の有効な価格を取得（最新の1つ）"""
-        price_history = self.price_histories.filter(
-            is_active=True,
-            start_date__lte=timezone.now().date()
-        ).order_by('-start_date').first()
-        
-        return price_history.price if price_history else None
+    # NOTE: current_price property has been removed to avoid conflicts with annotate()
+    # The field is now added in querysets using Part.objects.with_current_price()
     
     @property
     def current_prices(self):
         """現在有効な価格を全て取得（複数の場合あり）"""
+        today = timezone.localdate()
         return self.price_histories.filter(
             is_active=True,
-            start_date__lte=timezone.now().date()
+            start_date__lte=today
         ).filter(
-            models.Q(end_date__isnull=True) | models.Q(end_date__gte=timezone.now().date())
+            models.Q(end_date__isnull=True) | models.Q(end_date__gte=today)
         ).order_by('-start_date')
     
-    @property
-    def has_multiple_active_prices(self):
-        """複数の有効な価格が存在するかチェック"""
-        return self.current_prices.count() > 1
-    
-    # NOTE: price_history_count property has been removed to avoid conflicts with annotate()
-    # The field is now added dynamically in views using annotate()
+    # NOTE: has_multiple_active_prices property has been removed to avoid conflicts with annotate()
+    # The field is now added in querysets using Part.objects.with_has_multiple_active_prices()
 
 
 def quote_file_upload_path(instance, filename):
     """見積書ファイルのアップロードパスを生成"""
-    # ファイル名をサニタイズ
-    ext = os.path.splitext(filename)[1]
-    # parts/見積書/部品番号/YYYY/MM/ファイル名
-    date = timezone.now()
+    # ファイル名をサニタイズ（パス区切りや使用できない文字を除去）
+    filename = get_valid_filename(os.path.basename(filename))
+    # quotes/部品番号/YYYY/MM/ファイル名（作成済みの場合は作成日時を使用）
+    date = instance.created_at or timezone.now()
     return f"quotes/{instance.part.part_number}/{date.year}/{date.month:02d}/{filename}"
 
 
@@ -208,6 +340,7 @@ class PriceHistory(models.Model):
     )
     
     # ステータス
+    # 手動での無効化に使用する。実際に有効かどうかは with_status() の is_current で判定する
     is_active = models.BooleanField(
         default=True,
         verbose_name="有効",
@@ -230,6 +363,21 @@ class PriceHistory(models.Model):
         help_text="見積書のPDFやExcelファイル",
         max_length=500
     )
+    # ファイルがない場合はNULL（APIではnullを返す）
+    quote_file_name = models.CharField(
+        max_length=255,
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name="見積書ファイル名"
+    )
+    quote_file_size = models.PositiveBigIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name="見積書ファイルサイズ",
+        help_text="アップロード時に保存したファイルサイズ（バイト）"
+    )
     
     # 備考
     notes = models.TextField(
@@ -255,17 +403,32 @@ class PriceHistory(models.Model):
         verbose_name="作成者"
     )
     
+    objects = PriceHistoryQuerySet.as_manager()
+    
     class Meta:
         verbose_name = "価格履歴"
         verbose_name_plural = "価格履歴一覧"
         ordering = ['-start_date', '-created_at']
         db_table = "price_histories"
         indexes = [
-            models.Index(fields=['part', 'start_date']),
-            models.Index(fields=['part', 'is_active']),
+            # 一覧の絞り込み + 開始日・作成日時の降順の並び替え用
+            models.Index(fields=['part', '-start_date', '-created_at']),
+            models.Index(fields=['-start_date', '-created_at']),
+            # 現在単価の取得（部品・有効・開始日降順）をインデックスのみで完結させるカバリングインデックス
+            models.Index(fields=['part', 'is_active', '-start_date', 'price', 'end_date']),
             models.Index(fields=['start_date', 'end_date']),
+            models.Index(fields=['end_date']),
         ]
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 読み込み時の部品ID（シグナルでの価格履歴数の更新に使用）
+        # only()・defer()で読み込まれていない場合はNoneとし、保存時にDBの値を取得する
+        if 'part_id' in self.get_deferred_fields():
+            self._original_part_id = None
+        else:
+            self._original_part_id = self.part_id
+    
     def __str__(self):
         return f"{self.part.part_number} - ¥{self.price} ({self.start_date}〜)"
     
@@ -280,101 +443,47 @@ class PriceHistory(models.Model):
             })
         
         # 同じ部品で期間が重複する価格履歴がないかチェック（自分自身は除外）
+        if not self.part_id or not self.start_date:
+            return
+        
+        # 期間の重複判定をSQLで行い、最初の1件のみ取得する
         overlapping = PriceHistory.objects.filter(
-            part=self.part,
+            part_id=self.part_id,
             is_active=True
+        ).filter(
+            models.Q(end_date__isnull=True) | models.Q(end_date__gte=self.start_date)
         )
         
+        if self.end_date:
+            overlapping = overlapping.filter(start_date__lte=self.end_date)
+        
         if self.pk:
             overlapping = overlapping.exclude(pk=self.pk)
         
-        for history in overlapping:
-            # 期間の重複をチェック
-            if self._is_overlapping(history):
-                raise ValidationError(
-                    f"価格適用期間が既存の価格履歴（{history.start_date}〜{history.end_date or '無期限'}）と重複しています。"
-                )
-    
-    def _is_overlapping(self, other):
-        """期間の重複をチェックするヘルパーメソッド"""
-        # 自分の終了日が設定されていない場合
-        if not self.end_date:
-            # 相手の終了日も設定されていない場合は必ず重複
-            if not other.end_date:
-                return True
-            # 相手の終了日が自分の開始日以降なら重複
-            return other.end_date >= self.start_date
-        
-        # 相手の終了日が設定されていない場合
-        if not other.end_date:
-            # 自分の終了日が相手の開始日以降なら重複
-            return self.end_date >= other.start_date
-        
-        # 両方とも終了日が設定されている場合
-        return (
-            (self.start_date <= other.end_date) and
-            (self.end_date >= other.start_date)
-        )
+        history = overlapping.only('start_date', 'end_date').first()
+        if history:
+            raise ValidationError(
+                f"価格適用期間が既存の価格履歴（{history.start_date}〜{history.end_date or '無期限'}）と重複しています。"
+            )
     
     def save(self, *args, **kwargs):
         """保存時の処理"""
-        # 終了日を過ぎている場合は自動的に無効化
-        if self.end_date and self.end_date < timezone.now().date():
-            self.is_active = False
-        
-        super().save(*args, **kwargs)
-    
-    def delete(self, *args, **kwargs):
-        """削除時にファイルも削除"""
-        if self.quote_file:
-            # ファイルが存在する場合は削除
-            if os.path.isfile(self.quote_file.path):
-                os.remove(self.quote_file.path)
-        super().delete(*args, **kwargs)
-    
-    @property
-    def is_current(self):
-        """現在有効な価格かどうか"""
-        if not self.start_date:
-            return False
-        
-        today = timezone.now().date()
+        # NOTE: 終了日を過ぎた価格の無効化は expire_price_histories コマンドで一括実行する
         
-        if not self.is_active:
-            return False
+        # 見積書ファイルのファイル名・サイズを保存（読み取り時のstat()を避ける）
+        if self.quote_file and not self.quote_file._committed:
+            size = self.quote_file.size
+            # 保存先で確定したファイル名を取得するため、先にファイルを保存する
+            self.quote_file.save(self.quote_file.name, self.quote_file.file, save=False)
+            self.quote_file_name = os.path.basename(self.quote_file.name)
+            self.quote_file_size = size
+        elif not self.quote_file:
+            self.quote_file_name = None
+            self.quote_file_size = None
         
-        if self.start_date > today:
-            return False
-        
-        if self.end_date and self.end_date < today:
-            return False
-        
-        return True
-    
-    @property
-    def is_future(self):
-        """将来の価格かどうか"""
-        if not self.start_date:
-            return False
-        return self.start_date > timezone.now().date()
-    
-    @property
-    def is_expired(self):
-        """期限切れかどうか"""
-        if not self.end_date:
-            return False
-        return self.end_date < timezone.now().date()
+        super().save(*args, **kwargs)
     
-    @property
-    def quote_file_name(self):
-        """見積書ファイル名を取得"""
-        if self.quote_file:
-            return os.path.basename(self.quote_file.name)
-        return None
+    # NOTE: 見積書ファイルの削除はpost_deleteシグナル（api/purchases/signals.py）で行う
     
-    @property
-    def quote_file_size(self):
-        """見積書ファイルサイズを取得（バイト）"""
-        if self.quote_file:
-            return self.quote_file.size
-        return None
\ No newline at end of file
+    # NOTE: is_current / is_future / is_expired properties have been removed to avoid conflicts with annotate()
+    # The fields are now added in querysets using PriceHistory.objects.with_status()
@@ -0,0 +1,13 @@
+# api/purchases/pagination.py
+
+from rest_framework.pagination import CursorPagination
+
+
+class PartCursorPagination(CursorPagination):
+    """部品一覧のカーソルページネーション（品番順、同じ品番はID順）"""
+    ordering = ('part_number', 'id')
+
+
+class PriceHistoryCursorPagination(CursorPagination):
+    """価格履歴一覧のカーソルページネーション（開始日・作成日時の降順）"""
+    ordering = ('-start_date', '-created_at', '-id')
@@ -1,6 +1,9 @@
 # api/purchases/serializers.py
 
 from rest_framework import serializers
+from rest_framework.settings import api_settings
+from django.db.models import F
+from api.common.serializers import UniqueConstraintErrorMixin
 from api.purchases.models import Part, PriceHistory
 from decimal import Decimal
 
@@ -21,7 +24,7 @@ class PriceHistoryListSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'price', 'start_date', 'end_date', 'is_active',
             'is_current', 'is_future', 'is_expired',
-            'change_reason', 'created_at', 'created_by_name'
+            'created_at', 'created_by_name'
         ]
 
 
@@ -125,12 +128,41 @@ class PartListSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'part_number', 'part_name', 'product', 'product_number',
             'product_name', 'supplier_branch', 'supplier_name', 'branch_name',
-            'specification', 'unit', 'minimum_order_quantity',
+            'unit', 'minimum_order_quantity',
             'lead_time_days', 'current_price', 'price_history_count',
             'is_active', 'created_at'
         ]
 
 
+# 一覧でvalues()により取得する関連先の列（PartListSerializerと同じキー名で取得）
+PART_LIST_RELATED_VALUES = {
+    'product_number': F('product__product_number'),
+    'product_name': F('product__product_name'),
+    'supplier_name': F('supplier__company_name'),
+    'branch_name': F('supplier_branch__branch_name'),
+}
+PART_LIST_VALUES = [
+    field for field in PartListSerializer.Meta.fields
+    if field not in PART_LIST_RELATED_VALUES
+]
+
+_decimal_field = serializers.DecimalField(max_digits=12, decimal_places=2)
+
+
+def serialize_part_rows(rows):
+    """
+    values()で取得した行をPartListSerializerと同じ形式の辞書に変換する
+    一覧表示でモデルの生成とフィールド解決を省略するために使用
+    日時はORJSONRendererでDateTimeFieldと同じ形式に変換する
+    """
+    data = []
+    for row in rows:
+        if row['current_price'] is not None:
+            row['current_price'] = _decimal_field.to_representation(row['current_price'])
+        data.append({field: row[field] for field in PartListSerializer.Meta.fields})
+    return data
+
+
 class PartDetailSerializer(serializers.ModelSerializer):
     """部品詳細用のシリアライザー（価格履歴を含む）"""
     product_number = serializers.CharField(source='product.product_number', read_only=True)
@@ -177,8 +209,15 @@ class PartDetailSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at', 'created_by']
 
 
-class PartCreateUpdateSerializer(serializers.ModelSerializer):
+class PartCreateUpdateSerializer(UniqueConstraintErrorMixin, serializers.ModelSerializer):
     """部品作成・更新用のシリアライザー"""
+    unique_error_messages = {
+        # unique_together（製品・仕入先支店・品番）のインデックス名
+        'product_id_supplier_branch_id_part_number': (
+            api_settings.NON_FIELD_ERRORS_KEY,
+            "この製品と仕入先の組み合わせで、同じ品番が既に登録されています"
+        ),
+    }
     
     # ⭐ 追加: created_byを自動設定
     created_by = serializers.HiddenField(
@@ -199,45 +238,11 @@ class PartCreateUpdateSerializer(serializers.ModelSerializer):
             'part_number': {'required': True},
             'part_name': {'required': True},
         }
+        # unique_togetherの事前SELECTを行わず、保存時の一意制約違反で検出する
+        validators = []
 
     def validate_minimum_order_quantity(self, value):
         """最小発注数量の検証"""
         if value < 1:
             raise serializers.ValidationError("最小発注数量は1以上である必要があります")
         return value
-
-    def validate(self, attrs):
-        """重複チェック"""
-        product = attrs.get('product')
-        supplier_branch = attrs.get('supplier_branch')
-        part_number = attrs.get('part_number')
-        
-        # 同じ製品と仕入先の組み合わせで同じ品番が存在しないかチェック
-        instance = self.instance
-        if instance:
-            existing = Part.objects.filter(
-                product=product,
-                supplier_branch=supplier_branch,
-                part_number=part_number
-            ).exclude(pk=instance.pk)
-        else:
-            existing = Part.objects.filter(
-                product=product,
-                supplier_branch=supplier_branch,
-                part_number=part_number
-            )
-        
-        if existing.exists():
-            raise serializers.ValidationError(
-                "この製品と仕入先の組み合わせで、同じ品番が既に登録されています"
-            )
-        
-        return attrs
-
-    # ⭐ 削除: create メソッドは不要（HiddenFieldで自動設定される）
-    # def create(self, validated_data):
-    #     """部品の作成"""
-    #     request = self.context.get('request')
-    #     if request and hasattr(request, 'user'):
-    #         validated_data['created_by'] = request.user
-    #     return super().create(validated_data)
\ No newline at end of file
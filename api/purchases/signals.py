@@ -0,0 +1,106 @@
+# api/purchases/signals.py
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from api.products.models import Product
+from api.common.cache import invalidate_list_cache
+from api.purchases.models import Part, PriceHistory
+from api.supplier.models import Supplier, SupplierBranch
+
+
+@receiver(pre_save, sender=PriceHistory)
+def load_original_price_history_part(sender, instance, **kwargs):
+    """
+    読み込み時の部品IDが不明な場合（only()・defer()で読み込まれていない場合）はDBから取得
+    変更なしの保存を部品の変更として扱い、価格履歴数がずれるのを防ぐ
+    """
+    if instance._state.adding or instance._original_part_id is not None:
+        return
+    instance._original_part_id = PriceHistory.objects.filter(
+        pk=instance.pk
+    ).order_by().values_list('part_id', flat=True).first()
+
+
+@receiver(post_save, sender=PriceHistory)
+def increment_price_history_count(sender, instance, created, **kwargs):
+    """価格履歴の追加・部品の変更時に部品の価格履歴数を更新"""
+    original_part_id = instance._original_part_id
+    if created:
+        Part.objects.filter(pk=instance.part_id).update(
+            price_history_count=F('price_history_count') + 1
+        )
+    elif original_part_id and original_part_id != instance.part_id:
+        Part.objects.filter(pk=original_part_id).update(
+            price_history_count=F('price_history_count') - 1
+        )
+        Part.objects.filter(pk=instance.part_id).update(
+            price_history_count=F('price_history_count') + 1
+        )
+    instance._original_part_id = instance.part_id
+
+
+@receiver(post_delete, sender=PriceHistory)
+def decrement_price_history_count(sender, instance, **kwargs):
+    """価格履歴の削除時に部品の価格履歴数を更新"""
+    Part.objects.filter(pk=instance.part_id, price_history_count__gt=0).update(
+        price_history_count=F('price_history_count') - 1
+    )
+
+
+@receiver(post_save, sender=SupplierBranch)
+def sync_part_supplier(sender, instance, created, **kwargs):
+    """仕入先支店の仕入先が変更された場合に部品の仕入先を更新"""
+    if created:
+        return
+    Part.objects.filter(supplier_branch=instance).exclude(
+        supplier_id=instance.supplier_id
+    ).update(supplier_id=instance.supplier_id)
+
+
+@receiver(post_delete, sender=PriceHistory)
+def delete_quote_file(sender, instance, **kwargs):
+    """
+    価格履歴の削除時に見積書ファイルを削除
+    QuerySet.delete()による一括削除でも実行され、ストレージの種類に依存しない
+    """
+    if not instance.quote_file:
+        return
+    
+    storage = instance.quote_file.storage
+    name = instance.quote_file.name
+    # トランザクションがロールバックされた場合にファイルだけが消えないよう、コミット後に削除
+    transaction.on_commit(lambda: storage.delete(name))
+
+
+# 一覧に表示される内容（製品名・仕入先名・現在価格など）が変わるモデル
+LIST_CACHE_SENDERS = (Part, PriceHistory, Product, Supplier, SupplierBranch)
+
+
+def invalidate_purchases_list_cache(sender, **kwargs):
+    """部品・価格履歴一覧のキャッシュを無効化"""
+    invalidate_list_cache('purchases')
+
+
+for _sender in LIST_CACHE_SENDERS:
+    post_save.connect(invalidate_purchases_list_cache, sender=_sender)
+    post_delete.connect(invalidate_purchases_list_cache, sender=_sender)
+
+
+# 作成者名（created_by.full_name）の生成元となるユーザーの項目
+USER_NAME_FIELDS = {'first_name', 'last_name'}
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_purchases_list_cache_on_user_change(sender, update_fields=None, **kwargs):
+    """
+    ユーザーの氏名の変更・削除時に部品・価格履歴一覧のキャッシュを無効化（一覧に作成者名を含むため）
+    氏名以外の項目のみを更新した場合（update_fields指定時）は無効化しない
+    """
+    if update_fields is not None and not USER_NAME_FIELDS.intersection(update_fields):
+        return
+    invalidate_list_cache('purchases')
@@ -0,0 +1,66 @@
+# api/purchases/tests/test_cache.py
+
+from datetime import date
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from api.accounts.models import User
+from api.products.models import Product
+from api.purchases.models import Part, PriceHistory
+from api.supplier.models import Supplier, SupplierBranch
+
+
+class PurchasesListCacheTests(TestCase):
+    """価格履歴一覧（作成者名を含む）のキャッシュの無効化のテスト"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            'user1', 'user1@example.com', 'password', last_name='山田', first_name='太郎'
+        )
+        supplier = Supplier.objects.create(supplier_code='SUP001', company_name='株式会社ABC')
+        branch = SupplierBranch.objects.create(
+            supplier=supplier, branch_code='SUP001-HQ', branch_name='本社'
+        )
+        product = Product.objects.create(product_number='P001', product_name='製品A')
+        cls.part = Part.objects.create(
+            product=product, supplier_branch=branch, part_number='PT001',
+            part_name='部品A', created_by=cls.user
+        )
+        PriceHistory.objects.create(
+            part=cls.part, price=100, start_date=date(2020, 1, 1), created_by=cls.user
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def get_created_by_names(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return [row['created_by_name'] for row in response.json()['results']]
+
+    def rename_user(self, **kwargs):
+        with self.captureOnCommitCallbacks(execute=True):
+            for key, value in kwargs.items():
+                setattr(self.user, key, value)
+            self.user.save()
+
+    def test_user_rename_invalidates_price_history_list(self):
+        url = '/api/purchases/price-histories/'
+        self.assertEqual(self.get_created_by_names(url), ['山田 太郎'])
+        self.rename_user(first_name='次郎')
+        self.assertEqual(self.get_created_by_names(url), ['山田 次郎'])
+
+    def test_other_user_fields_keep_cache(self):
+        url = '/api/purchases/price-histories/'
+        self.get_created_by_names(url)
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.filter(pk=self.user.pk).update(last_name='佐藤')
+            self.user.phone_number = '052-000-0000'
+            self.user.save(update_fields=['phone_number'])
+        # 氏名以外の更新では無効化しない（update()は意図的にキャッシュに反映されない）
+        self.assertEqual(self.get_created_by_names(url), ['山田 太郎'])
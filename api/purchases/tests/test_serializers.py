@@ -0,0 +1,41 @@
+# api/purchases/tests/test_serializers.py
+
+from django.db import IntegrityError
+from django.test import SimpleTestCase
+from rest_framework import serializers
+from rest_framework.settings import api_settings
+
+from api.purchases.serializers import PartCreateUpdateSerializer
+
+
+class PartUniqueErrorTests(SimpleTestCase):
+    """部品の一意制約違反の変換（UniqueConstraintErrorMixin）のテスト"""
+
+    def raise_unique_error(self, *args):
+        PartCreateUpdateSerializer()._raise_unique_error(IntegrityError(*args))
+
+    def test_duplicate_part_number(self):
+        with self.assertRaises(serializers.ValidationError) as context:
+            self.raise_unique_error(
+                1062,
+                "Duplicate entry '1-1-PT001' for key "
+                "'parts.parts_product_id_supplier_branch_id_part_number_98d0efc3_uniq'"
+            )
+        self.assertIn(api_settings.NON_FIELD_ERRORS_KEY, context.exception.detail)
+
+    def test_foreign_key_error_is_reraised(self):
+        with self.assertRaises(IntegrityError):
+            self.raise_unique_error(
+                1452,
+                "Cannot add or update a child row: a foreign key constraint fails "
+                "(`meiwa-product`.`parts`, CONSTRAINT `parts_product_id_fk` "
+                "FOREIGN KEY (`product_id`) REFERENCES `products` (`id`))"
+            )
+
+    def test_not_null_error_is_reraised(self):
+        with self.assertRaises(IntegrityError):
+            self.raise_unique_error(1048, "Column 'part_name' cannot be null")
+
+    def test_other_unique_key_is_reraised(self):
+        with self.assertRaises(IntegrityError):
+            self.raise_unique_error(1062, "Duplicate entry '1' for key 'parts.PRIMARY'")
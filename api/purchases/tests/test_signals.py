@@ -0,0 +1,76 @@
+# api/purchases/tests/test_signals.py
+
+from datetime import date
+
+from django.test import TestCase
+
+from api.products.models import Product
+from api.purchases.models import Part, PriceHistory
+from api.supplier.models import Supplier, SupplierBranch
+
+
+class PriceHistoryCountTests(TestCase):
+    """部品の価格履歴数（シグナルで更新）のテスト"""
+
+    def setUp(self):
+        supplier = Supplier.objects.create(supplier_code='SUP001', company_name='株式会社ABC')
+        branch = SupplierBranch.objects.create(
+            supplier=supplier, branch_code='SUP001-HQ', branch_name='本社'
+        )
+        product = Product.objects.create(product_number='P001', product_name='製品A')
+        self.part = Part.objects.create(
+            product=product, supplier_branch=branch, part_number='PT001', part_name='部品A'
+        )
+        self.other = Part.objects.create(
+            product=product, supplier_branch=branch, part_number='PT002', part_name='部品B'
+        )
+
+    def create_price(self, part=None, price=100):
+        return PriceHistory.objects.create(
+            part=part or self.part, price=price, start_date=date(2020, 1, 1)
+        )
+
+    def assertCounts(self, part_count, other_count):
+        self.assertEqual(
+            list(Part.objects.order_by('part_number').values_list('price_history_count', flat=True)),
+            [part_count, other_count]
+        )
+
+    def test_create_and_delete(self):
+        price = self.create_price()
+        self.create_price(price=200)
+        self.assertCounts(2, 0)
+
+        price.delete()
+        self.assertCounts(1, 0)
+
+    def test_move_to_other_part(self):
+        price = self.create_price()
+        price.part = self.other
+        price.save()
+        self.assertCounts(0, 1)
+
+    def test_queryset_delete(self):
+        self.create_price()
+        self.create_price(price=200)
+        PriceHistory.objects.all().delete()
+        self.assertCounts(0, 0)
+
+    def test_update_without_part_change(self):
+        # 読み込み時の部品IDを保持しているため、更新前の値の取得は行わない
+        price = PriceHistory.objects.get(pk=self.create_price().pk)
+        price.price = 200
+        with self.assertNumQueries(1):
+            price.save()
+        self.assertCounts(1, 0)
+
+    def test_move_deferred_instance(self):
+        # only()で部品IDを読み込んでいない場合もDBの値から部品の変更を判定する
+        price = PriceHistory.objects.only('price').get(pk=self.create_price().pk)
+        price.part = self.other
+        price.save()
+        self.assertCounts(0, 1)
+
+        price.price = 200
+        price.save()
+        self.assertCounts(0, 1)
@@ -0,0 +1,125 @@
+# api/purchases/tests/test_views.py
+
+from datetime import date
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from api.accounts.models import User
+from api.products.models import Product
+from api.purchases.models import Part, PriceHistory
+from api.purchases.pagination import PartCursorPagination
+from api.purchases.serializers import PartListSerializer
+from api.supplier.models import Supplier, SupplierBranch
+
+
+class PartListViewTests(TestCase):
+    """部品一覧（values()の辞書・カーソルページネーション・検索）のテスト"""
+
+    url = '/api/purchases/parts/'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('user1', 'user1@example.com', 'password')
+        supplier = Supplier.objects.create(supplier_code='SUP001', company_name='株式会社ABC')
+        other_supplier = Supplier.objects.create(supplier_code='SUP002', company_name='株式会社XYZ')
+        branch = SupplierBranch.objects.create(
+            supplier=supplier, branch_code='SUP001-HQ', branch_name='本社'
+        )
+        other_branch = SupplierBranch.objects.create(
+            supplier=other_supplier, branch_code='SUP002-HQ', branch_name='本社'
+        )
+        product = Product.objects.create(product_number='P001', product_name='ブラケット')
+        other_product = Product.objects.create(product_number='P002', product_name='ハウジング')
+
+        cls.part = Part.objects.create(
+            product=product, supplier_branch=branch, part_number='PT001', part_name='ボルト'
+        )
+        PriceHistory.objects.create(part=cls.part, price=12, start_date=date(2020, 1, 1))
+        Part.objects.create(
+            product=product, supplier_branch=branch, part_number='PT002', part_name='ナット'
+        )
+        Part.objects.create(
+            product=other_product, supplier_branch=other_branch, part_number='PT003', part_name='ワッシャー'
+        )
+        Part.objects.create(
+            product=other_product, supplier_branch=other_branch, part_number='PT004', part_name='ピン'
+        )
+        Part.objects.create(
+            product=other_product, supplier_branch=other_branch, part_number='PT005', part_name='ボルト（長）'
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def part_numbers(self, params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return [row['part_number'] for row in response.json()['results']]
+
+    def test_rows_match_serializer(self):
+        row = self.client.get(self.url).json()['results'][0]
+        part = Part.objects.with_list_joins().get(pk=self.part.pk)
+        # values()の辞書からの出力がPartListSerializerの出力と一致する（日時の形式を含む）
+        self.assertEqual(row, dict(PartListSerializer(part).data))
+        self.assertEqual(row['current_price'], '12.00')
+        self.assertEqual(row['supplier_name'], '株式会社ABC')
+
+    def test_cursor_pagination(self):
+        seen = []
+        with mock.patch.object(PartCursorPagination, 'page_size', 2):
+            url = self.url
+            while url:
+                data = self.client.get(url).json()
+                seen.extend(row['part_number'] for row in data['results'])
+                url = data['next']
+        self.assertEqual(seen, ['PT001', 'PT002', 'PT003', 'PT004', 'PT005'])
+
+    def test_search_part_name(self):
+        self.assertEqual(self.part_numbers({'search': 'ボルト'}), ['PT001', 'PT005'])
+
+    def test_search_product_name(self):
+        self.assertEqual(self.part_numbers({'search': 'ハウジング'}), ['PT003', 'PT004', 'PT005'])
+
+    def test_search_supplier_name(self):
+        self.assertEqual(self.part_numbers({'search': 'ABC'}), ['PT001', 'PT002'])
+
+    def test_filter_supplier(self):
+        supplier = Supplier.objects.get(supplier_code='SUP002')
+        self.assertEqual(self.part_numbers({'supplier': supplier.pk}), ['PT003', 'PT004', 'PT005'])
+
+    def test_invalid_filter(self):
+        response = self.client.get(self.url, {'supplier': 'abc'})
+        self.assertEqual(response.status_code, 400)
+
+
+class PriceHistoryDetailViewTests(TestCase):
+    """価格履歴詳細のテスト"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('user1', 'user1@example.com', 'password')
+        supplier = Supplier.objects.create(supplier_code='SUP001', company_name='株式会社ABC')
+        branch = SupplierBranch.objects.create(
+            supplier=supplier, branch_code='SUP001-HQ', branch_name='本社'
+        )
+        product = Product.objects.create(product_number='P001', product_name='ブラケット')
+        part = Part.objects.create(
+            product=product, supplier_branch=branch, part_number='PT001', part_name='ボルト'
+        )
+        cls.price_history = PriceHistory.objects.create(part=part, price=12, start_date=date(2020, 1, 1))
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_without_quote_file(self):
+        # 見積書ファイルがない場合、ファイル名・サイズはnullを返す
+        response = self.client.get(f'/api/purchases/price-histories/{self.price_history.pk}/')
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.json()['quote_file_name'])
+        self.assertIsNone(response.json()['quote_file_size'])
@@ -2,10 +2,13 @@
 
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
-from django.db.models import Count, Q, Prefetch
+from django_filters.rest_framework import DjangoFilterBackend
 import logging
 
+from api.common.cache import CachedListMixin
+from api.purchases.filters import PartFilter, PriceHistoryFilter
 from api.purchases.models import Part, PriceHistory
+from api.purchases.pagination import PartCursorPagination, PriceHistoryCursorPagination
 from api.purchases.serializers import (
     PartListSerializer,
     PartDetailSerializer,
@@ -13,6 +16,9 @@ from api.purchases.serializers import (
     PriceHistoryListSerializer,
     PriceHistoryDetailSerializer,
     PriceHistoryCreateUpdateSerializer,
+    PART_LIST_VALUES,
+    PART_LIST_RELATED_VALUES,
+    serialize_part_rows,
 )
 
 logger = logging.getLogger(__name__)
@@ -31,58 +37,41 @@ class IsAdminUser(permissions.BasePermission):
 
 # ==================== Part Views ====================
 
-class PartListCreateView(generics.ListCreateAPIView):
-    """部品一覧取得・作成ビュー"""
+class PartListCreateView(CachedListMixin, generics.ListCreateAPIView):
+    """部品一覧取得・作成ビュー（一覧は短時間キャッシュ）"""
     permission_classes = [permissions.IsAuthenticated]
+    list_cache_namespace = 'purchases'
+    list_cache_prefix = 'parts'
+    pagination_class = PartCursorPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = PartFilter
 
     def get_queryset(self):
-        """クエリセットを取得"""
-        queryset = Part.objects.select_related(
-            'product',
-            'supplier_branch__supplier',
-            'created_by'
-        ).annotate(
-            price_history_count=Count('price_histories')
-        )
-        
-        # フィルタリング
-        product_id = self.request.query_params.get('product', None)
-        if product_id:
-            queryset = queryset.filter(product_id=product_id)
-        
-        supplier_id = self.request.query_params.get('supplier', None)
-        if supplier_id:
-            queryset = queryset.filter(supplier_branch__supplier_id=supplier_id)
-        
-        branch_id = self.request.query_params.get('branch', None)
-        if branch_id:
-            queryset = queryset.filter(supplier_branch_id=branch_id)
-        
-        is_active = self.request.query_params.get('is_active', None)
-        if is_active is not None:
-            queryset = queryset.filter(is_active=is_active.lower() == 'true')
-        
-        search = self.request.query_params.get('search', None)
-        if search:
-            queryset = queryset.filter(
-                Q(part_number__icontains=search) |
-                Q(part_name__icontains=search) |
-                Q(product__product_number__icontains=search) |
-                Q(product__product_name__icontains=search) |
-                Q(supplier_branch__supplier__company_name__icontains=search)
-            )
-        
-        return queryset.order_by('part_number')
+        """クエリセットを取得（絞り込みはPartFilter、並び順はPartCursorPaginationで行う）"""
+        # 取得する列はlist()でvalues()により絞り込む（仕様などの長いテキストは取得しない）
+        return Part.objects.with_current_price()
 
     def get_serializer_class(self):
         if self.request.method == 'POST':
             return PartCreateUpdateSerializer
         return PartListSerializer
 
+    def _build_list_data(self):
+        """部品一覧のデータを生成（モデルを生成せずvalues()の辞書から返す）"""
+        queryset = self.filter_queryset(self.get_queryset()).values(
+            *PART_LIST_VALUES, **PART_LIST_RELATED_VALUES
+        )
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serialize_part_rows(page)).data
+
+        return serialize_part_rows(queryset)
+
     def create(self, request, *args, **kwargs):
         """部品作成（デバッグログ付き）"""
-        logger.info(f"[Part Create] User: {request.user}")
-        logger.info(f"[Part Create] Data: {request.data}")
+        logger.info("[Part Create] User: %s", request.user)
+        logger.info("[Part Create] Data: %s", request.data)
         
         try:
             serializer = self.get_serializer(data=request.data)
@@ -92,15 +81,15 @@ class PartListCreateView(generics.ListCreateAPIView):
             self.perform_create(serializer)
             
             headers = self.get_success_headers(serializer.data)
-            logger.info(f"[Part Create] Success: Part ID {serializer.data.get('id')}")
+            logger.info("[Part Create] Success: Part ID %s", serializer.data.get('id'))
             
             return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
             
         except Exception as e:
-            logger.error(f"[Part Create] Error: {str(e)}")
-            logger.error(f"[Part Create] Error type: {type(e).__name__}")
+            logger.error("[Part Create] Error: %s", e)
+            logger.error("[Part Create] Error type: %s", type(e).__name__)
             if hasattr(e, 'detail'):
-                logger.error(f"[Part Create] Error detail: {e.detail}")
+                logger.error("[Part Create] Error detail: %s", e.detail)
             raise
 
     def perform_create(self, serializer):
@@ -116,21 +105,11 @@ class PartDetailView(generics.RetrieveUpdateDestroyAPIView):
 
     def get_queryset(self):
         """クエリセットを取得"""
-        # 価格履歴を最適化して取得
-        price_histories_prefetch = Prefetch(
-            'price_histories',
-            queryset=PriceHistory.objects.select_related('created_by').order_by('-start_date', '-created_at')
-        )
+        # 削除時は価格履歴数（price_history_count）のみ使用するため、関連の取得は行わない
+        if self.request.method == 'DELETE':
+            return Part.objects.all()
         
-        return Part.objects.select_related(
-            'product',
-            'supplier_branch__supplier',
-            'created_by'
-        ).prefetch_related(
-            price_histories_prefetch
-        ).annotate(
-            price_history_count=Count('price_histories')
-        )
+        return Part.objects.with_detail_joins()
 
     def get_serializer_class(self):
         if self.request.method in ['PUT', 'PATCH']:
@@ -147,8 +126,8 @@ class PartDetailView(generics.RetrieveUpdateDestroyAPIView):
         
         instance = self.get_object()
         
-        # 価格履歴が存在するかチェック
-        if instance.price_histories.exists():
+        # 価格履歴が存在するかチェック（価格履歴数の列を使用）
+        if instance.price_history_count > 0:
             return Response(
                 {"error": "価格履歴が存在するため削除できません。無効化を検討してください。"},
                 status=status.HTTP_400_BAD_REQUEST
@@ -160,58 +139,18 @@ class PartDetailView(generics.RetrieveUpdateDestroyAPIView):
 
 # ==================== PriceHistory Views ====================
 
-class PriceHistoryListCreateView(generics.ListCreateAPIView):
-    """価格履歴一覧取得・作成ビュー"""
+class PriceHistoryListCreateView(CachedListMixin, generics.ListCreateAPIView):
+    """価格履歴一覧取得・作成ビュー（一覧は短時間キャッシュ）"""
     permission_classes = [permissions.IsAuthenticated]
+    list_cache_namespace = 'purchases'
+    list_cache_prefix = 'price_histories'
+    pagination_class = PriceHistoryCursorPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = PriceHistoryFilter
 
     def get_queryset(self):
-        """クエリセットを取得"""
-        queryset = PriceHistory.objects.select_related(
-            'part__product',
-            'part__supplier_branch__supplier',
-            'created_by'
-        )
-        
-        # フィルタリング
-        part_id = self.request.query_params.get('part', None)
-        if part_id:
-            queryset = queryset.filter(part_id=part_id)
-        
-        product_id = self.request.query_params.get('product', None)
-        if product_id:
-            queryset = queryset.filter(part__product_id=product_id)
-        
-        is_active = self.request.query_params.get('is_active', None)
-        if is_active is not None:
-            queryset = queryset.filter(is_active=is_active.lower() == 'true')
-        
-        # 有効期間フィルタ
-        status_filter = self.request.query_params.get('status', None)
-        if status_filter == 'current':
-            # 現在有効な価格のみ
-            from django.utils import timezone
-            today = timezone.now().date()
-            queryset = queryset.filter(
-                is_active=True,
-                start_date__lte=today
-            ).filter(
-                Q(end_date__isnull=True) | Q(end_date__gte=today)
-            )
-        elif status_filter == 'future':
-            # 将来の価格のみ
-            from django.utils import timezone
-            today = timezone.now().date()
-            queryset = queryset.filter(start_date__gt=today)
-        elif status_filter == 'expired':
-            # 期限切れのみ
-            from django.utils import timezone
-            today = timezone.now().date()
-            queryset = queryset.filter(
-                end_date__isnull=False,
-                end_date__lt=today
-            )
-        
-        return queryset.order_by('-start_date', '-created_at')
+        """クエリセットを取得（絞り込みはPriceHistoryFilter、並び順はPriceHistoryCursorPaginationで行う）"""
+        return PriceHistory.objects.with_list_joins()
 
     def get_serializer_class(self):
         if self.request.method == 'POST':
@@ -220,9 +159,14 @@ class PriceHistoryListCreateView(generics.ListCreateAPIView):
 
     def create(self, request, *args, **kwargs):
         """価格履歴作成（デバッグログ付き）"""
-        logger.info(f"[PriceHistory Create] User: {request.user}")
-        logger.info(f"[PriceHistory Create] Data: {request.data}")
-        logger.info(f"[PriceHistory Create] Files: {request.FILES}")
+        logger.info("[PriceHistory Create] User: %s", request.user)
+        logger.info("[PriceHistory Create] Data: %s", request.data)
+        if logger.isEnabledFor(logging.INFO):
+            # ファイルの内容・属性は出力せず、ファイル名のみ記録する
+            logger.info(
+                "[PriceHistory Create] Files: %s",
+                {key: file.name for key, file in request.FILES.items()}
+            )
         
         try:
             serializer = self.get_serializer(data=request.data)
@@ -232,15 +176,15 @@ class PriceHistoryListCreateView(generics.ListCreateAPIView):
             self.perform_create(serializer)
             
             headers = self.get_success_headers(serializer.data)
-            logger.info(f"[PriceHistory Create] Success: PriceHistory ID {serializer.data.get('id')}")
+            logger.info("[PriceHistory Create] Success: PriceHistory ID %s", serializer.data.get('id'))
             
             return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
             
         except Exception as e:
-            logger.error(f"[PriceHistory Create] Error: {str(e)}")
-            logger.error(f"[PriceHistory Create] Error type: {type(e).__name__}")
+            logger.error("[PriceHistory Create] Error: %s", e)
+            logger.error("[PriceHistory Create] Error type: %s", type(e).__name__)
             if hasattr(e, 'detail'):
-                logger.error(f"[PriceHistory Create] Error detail: {e.detail}")
+                logger.error("[PriceHistory Create] Error detail: %s", e.detail)
             raise
 
     def perform_create(self, serializer):
@@ -256,11 +200,7 @@ class PriceHistoryDetailView(generics.RetrieveUpdateDestroyAPIView):
 
     def get_queryset(self):
         """クエリセットを取得"""
-        return PriceHistory.objects.select_related(
-            'part__product',
-            'part__supplier_branch__supplier',
-            'created_by'
-        )
+        return PriceHistory.objects.with_details()
 
     def get_serializer_class(self):
         if self.request.method in ['PUT', 'PATCH']:
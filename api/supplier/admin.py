@@ -9,6 +9,10 @@ class SupplierBranchInline(admin.TabularInline):
     fields = ['branch_code', 'branch_name', 'branch_type', 'phone_number', 'email', 'is_active']
     readonly_fields = []
 
+    def get_queryset(self, request):
+        """行ごとの表示（__str__）で参照するサプライヤーをまとめて取得"""
+        return super().get_queryset(request).select_related('supplier')
+
 
 class SupplierContactInline(admin.TabularInline):
     """担当者のインライン"""
@@ -17,6 +21,10 @@ class SupplierContactInline(admin.TabularInline):
     fields = ['name', 'department', 'email', 'phone_number', 'responsibility', 'is_primary', 'is_active']
     readonly_fields = []
 
+    def get_queryset(self, request):
+        """行ごとの表示（__str__）で参照する拠点・サプライヤーをまとめて取得"""
+        return super().get_queryset(request).select_related('branch__supplier')
+
 
 @admin.register(Supplier)
 class SupplierAdmin(admin.ModelAdmin):
@@ -47,11 +55,6 @@ class SupplierAdmin(admin.ModelAdmin):
     )
     
     inlines = [SupplierBranchInline]
-    
-    def active_branches_count(self, obj):
-        """有効な拠点数"""
-        return obj.active_branches_count
-    active_branches_count.short_description = '有効拠点数'
 
 
 @admin.register(SupplierBranch)
@@ -96,6 +99,18 @@ class SupplierBranchAdmin(admin.ModelAdmin):
     def get_queryset(self, request):
         """最適化されたクエリセット"""
         return super().get_queryset(request).select_related('supplier')
+    
+    def save_formset(self, request, form, formset, change):
+        """インラインフォームセット保存時の処理（フォームで検証済みのため再検証しない）"""
+        instances = formset.save(commit=False)
+        for obj in formset.deleted_objects:
+            obj.delete()
+        for instance in instances:
+            if isinstance(instance, SupplierContact):
+                instance.save(skip_validation=True)
+            else:
+                instance.save()
+        formset.save_m2m()
 
 
 @admin.register(SupplierContact)
@@ -154,3 +169,7 @@ class SupplierContactAdmin(admin.ModelAdmin):
         return super().get_queryset(request).select_related(
             'branch__supplier'
         )
+    
+    def save_model(self, request, obj, form, change):
+        """保存時の処理（フォームで検証済みのため再検証しない）"""
+        obj.save(skip_validation=True)
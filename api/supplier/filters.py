@@ -0,0 +1,61 @@
+# api/supplier/filters.py
+
+from django_filters import rest_framework as filters
+
+from api.common.search import fulltext_filter
+from api.supplier.models import Supplier, SupplierBranch, SupplierContact
+
+
+class SupplierFilter(filters.FilterSet):
+    """サプライヤー一覧のフィルタ"""
+    is_active = filters.BooleanFilter()
+    search = filters.CharFilter(method='filter_search')
+
+    class Meta:
+        model = Supplier
+        fields = ['is_active', 'search']
+
+    def filter_search(self, queryset, name, value):
+        """サプライヤーコード・企業名で検索（FULLTEXTインデックス suppliers_search_ft を使用）"""
+        return queryset.filter(fulltext_filter(['supplier_code', 'company_name'], value))
+
+
+class SupplierBranchFilter(filters.FilterSet):
+    """サプライヤー拠点一覧のフィルタ"""
+    supplier = filters.NumberFilter(field_name='supplier_id')
+    branch_type = filters.ChoiceFilter(choices=SupplierBranch.BranchType.choices)
+    is_active = filters.BooleanFilter()
+    search = filters.CharFilter(method='filter_search')
+
+    class Meta:
+        model = SupplierBranch
+        fields = ['supplier', 'branch_type', 'is_active', 'search']
+
+    def filter_search(self, queryset, name, value):
+        """
+        拠点コード・拠点名・企業名で検索（FULLTEXTインデックス supplier_branches_search_ft を使用）
+        企業名は拠点に同期した列（supplier_company_name）を使用し、サプライヤーを結合しない
+        """
+        return queryset.filter(
+            fulltext_filter(['branch_code', 'branch_name', 'supplier_company_name'], value)
+        )
+
+
+class SupplierContactFilter(filters.FilterSet):
+    """サプライヤー担当者一覧のフィルタ"""
+    branch = filters.NumberFilter(field_name='branch_id')
+    supplier = filters.NumberFilter(field_name='branch__supplier_id')
+    responsibility = filters.ChoiceFilter(choices=SupplierContact.ResponsibilityChoices.choices)
+    is_active = filters.BooleanFilter()
+    is_primary = filters.BooleanFilter()
+    search = filters.CharFilter(method='filter_search')
+
+    class Meta:
+        model = SupplierContact
+        fields = ['branch', 'supplier', 'responsibility', 'is_active', 'is_primary', 'search']
+
+    def filter_search(self, queryset, name, value):
+        """担当者名・カナ・メールアドレス・部署で検索（FULLTEXTインデックス supplier_contacts_search_ft を使用）"""
+        return queryset.filter(
+            fulltext_filter(['name', 'name_kana', 'email', 'department'], value)
+        )
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.7 on 2026-10-15 15:20
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def fill_active_branches_count(apps, schema_editor):
+    """既存のサプライヤーの有効拠点数を集計して保存"""
+    Supplier = apps.get_model("supplier", "Supplier")
+    SupplierBranch = apps.get_model("supplier", "SupplierBranch")
+    active_branches_count = (
+        SupplierBranch.objects.filter(supplier=models.OuterRef("pk"), is_active=True)
+        .order_by()
+        .values("supplier")
+        .annotate(count=models.Count("pk"))
+        .values("count")
+    )
+    Supplier.objects.update(
+        active_branches_count=Coalesce(
+            models.Subquery(active_branches_count, output_field=models.IntegerField()),
+            0,
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("supplier", "0002_alter_supplier_company_name_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="supplier",
+            name="active_branches_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="有効拠点数"
+            ),
+        ),
+        migrations.RunPython(fill_active_branches_count, migrations.RunPython.noop),
+    ]
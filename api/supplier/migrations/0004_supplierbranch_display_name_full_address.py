@@ -0,0 +1,73 @@
+# Generated by Django 5.2.7 on 2026-10-15 17:05
+
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+def fill_supplier_company_name(apps, schema_editor):
+    """既存の拠点にサプライヤーの企業名を設定"""
+    Supplier = apps.get_model("supplier", "Supplier")
+    SupplierBranch = apps.get_model("supplier", "SupplierBranch")
+    SupplierBranch.objects.update(
+        supplier_company_name=models.Subquery(
+            Supplier.objects.filter(pk=models.OuterRef("supplier_id")).values(
+                "company_name"
+            )[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("supplier", "0003_supplier_active_branches_count"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="supplierbranch",
+            name="supplier_company_name",
+            field=models.CharField(
+                default="", editable=False, max_length=200, verbose_name="企業名"
+            ),
+        ),
+        migrations.RunPython(fill_supplier_company_name, migrations.RunPython.noop),
+        migrations.AddField(
+            model_name="supplierbranch",
+            name="display_name",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.functions.text.Concat(
+                    "supplier_company_name", models.Value(" "), "branch_name"
+                ),
+                output_field=models.CharField(max_length=401),
+                verbose_name="表示名",
+            ),
+        ),
+        migrations.AddField(
+            model_name="supplierbranch",
+            name="full_address",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.Case(
+                    models.When(
+                        address__gt="",
+                        postal_code__gt="",
+                        then=django.db.models.functions.text.Concat(
+                            models.Value("〒"),
+                            "postal_code",
+                            models.Value(" "),
+                            "address",
+                            output_field=models.TextField(),
+                        ),
+                    ),
+                    default=django.db.models.functions.comparison.Coalesce(
+                        "address", models.Value(""), output_field=models.TextField()
+                    ),
+                ),
+                output_field=models.TextField(),
+                verbose_name="完全な住所",
+            ),
+        ),
+    ]
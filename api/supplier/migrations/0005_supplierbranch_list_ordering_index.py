@@ -0,0 +1,20 @@
+# Generated by Django 5.2.7 on 2026-10-15 17:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("supplier", "0004_supplierbranch_display_name_full_address"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="supplierbranch",
+            index=models.Index(
+                fields=["supplier_company_name", "branch_type", "branch_name"],
+                name="supplier_br_supplie_506f7b_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.7 on 2026-10-15 17:55
+
+from django.db import migrations
+
+
+# {インデックス名: (テーブル名, 列)}
+FULLTEXT_INDEXES = {
+    "suppliers_search_ft": ("suppliers", "supplier_code, company_name"),
+    "supplier_branches_search_ft": (
+        "supplier_branches", "branch_code, branch_name, supplier_company_name"
+    ),
+    "supplier_contacts_search_ft": (
+        "supplier_contacts", "name, name_kana, email, department"
+    ),
+}
+
+
+def create_fulltext_indexes(apps, schema_editor):
+    """サプライヤー・拠点・担当者検索用のFULLTEXTインデックスを作成（MySQLのみ）"""
+    if schema_editor.connection.vendor != "mysql":
+        return
+    for name, (table, columns) in FULLTEXT_INDEXES.items():
+        schema_editor.execute(
+            f"CREATE FULLTEXT INDEX {name} ON {table} ({columns}) WITH PARSER ngram"
+        )
+
+
+def drop_fulltext_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "mysql":
+        return
+    for name, (table, columns) in FULLTEXT_INDEXES.items():
+        schema_editor.execute(f"DROP INDEX {name} ON {table}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("supplier", "0005_supplierbranch_list_ordering_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fulltext_indexes, drop_fulltext_indexes),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.2.7 on 2026-10-15 20:10
+
+from django.db import migrations
+
+
+# {インデックス名: (テーブル名, 列)}
+FULLTEXT_INDEXES = {
+    "suppliers_search_ft": ("suppliers", "supplier_code, company_name"),
+    "supplier_branches_search_ft": (
+        "supplier_branches", "branch_code, branch_name, supplier_company_name"
+    ),
+    "supplier_contacts_search_ft": (
+        "supplier_contacts", "name, name_kana, email, department"
+    ),
+}
+
+
+def _recreate_fulltext_indexes(schema_editor, enable_stopword):
+    if schema_editor.connection.vendor != "mysql":
+        return
+    # ストップワードの扱いはインデックスの作成時に決まる
+    schema_editor.execute(
+        "SET SESSION innodb_ft_enable_stopword = %s" % ("ON" if enable_stopword else "OFF")
+    )
+    try:
+        for name, (table, columns) in FULLTEXT_INDEXES.items():
+            schema_editor.execute(f"DROP INDEX {name} ON {table}")
+            schema_editor.execute(
+                f"CREATE FULLTEXT INDEX {name} ON {table} ({columns}) WITH PARSER ngram"
+            )
+    finally:
+        schema_editor.execute("SET SESSION innodb_ft_enable_stopword = DEFAULT")
+
+
+def recreate_without_stopwords(apps, schema_editor):
+    """
+    FULLTEXTインデックスをストップワードなしで再作成（MySQLのみ）
+    ストップワードを含むトークンが索引されず、icontainsと検索結果が異なるのを防ぐ
+    """
+    _recreate_fulltext_indexes(schema_editor, enable_stopword=False)
+
+
+def recreate_with_stopwords(apps, schema_editor):
+    _recreate_fulltext_indexes(schema_editor, enable_stopword=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("supplier", "0006_supplier_search_fulltext_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(recreate_without_stopwords, recreate_with_stopwords),
+    ]
@@ -1,8 +1,10 @@
 # api/supplier/models.py
 
-from django.db import models
+from django.db import models, transaction
 from django.core.validators import RegexValidator
 from django.core.exceptions import ValidationError
+from django.db.models import Case, When
+from django.db.models.functions import Coalesce, Concat
 
 # Create your models here.
 
@@ -42,6 +44,15 @@ class Supplier(models.Model):
         help_text='取引中のサプライヤーかどうか'
     )
 
+    # 有効な拠点数（拠点の保存・削除時にシグナルで更新）
+    # NOTE: QuerySet.update()・bulk_update()・bulk_create()ではシグナルが送られず更新されない
+    #       これらで拠点のサプライヤー・有効フラグを変更した場合は recount_active_branches() を実行する
+    active_branches_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='有効拠点数'
+    )
+
     # タイムスタンプ
     created_at = models.DateTimeField(
         auto_now_add=True,
@@ -62,6 +73,19 @@ class Supplier(models.Model):
     def __str__(self):
         return self.company_name
 
+    @classmethod
+    def recount_active_branches(cls, suppliers=None):
+        """有効拠点数を拠点から再集計する（suppliers未指定の場合は全てのサプライヤー）"""
+        queryset = cls.objects.all() if suppliers is None else suppliers
+        active_branches_count = SupplierBranch.objects.filter(
+            supplier=models.OuterRef('pk'), is_active=True
+        ).order_by().values('supplier').annotate(count=models.Count('pk')).values('count')
+        return queryset.update(
+            active_branches_count=Coalesce(
+                models.Subquery(active_branches_count, output_field=models.IntegerField()), 0
+            )
+        )
+
     
 class SupplierBranch(models.Model):
     """サプライヤー拠点（本店・支店）モデル - 中間層"""
@@ -96,6 +120,22 @@ class SupplierBranch(models.Model):
         help_text='例: 本社、名古屋支店, 安城営業所'
     )
 
+    # サプライヤーの企業名（表示名の生成用にシグナルで同期する）
+    supplier_company_name = models.CharField(
+        max_length=200,
+        default='',
+        editable=False,
+        verbose_name='企業名'
+    )
+
+    # 「企業名 拠点名」をDB側で生成する
+    display_name = models.GeneratedField(
+        expression=Concat('supplier_company_name', models.Value(' '), 'branch_name'),
+        output_field=models.CharField(max_length=401),
+        db_persist=True,
+        verbose_name='表示名'
+    )
+
     branch_type = models.CharField(
         max_length=20,
         choices=BranchType.choices,
@@ -117,6 +157,25 @@ class SupplierBranch(models.Model):
         verbose_name='住所'
     )
 
+    # 「〒郵便番号 住所」をDB側で生成する（郵便番号・住所のどちらかが空なら住所のみ）
+    # NULLは比較でFalseになるため、__gt=''で「NULLでも空文字でもない」を判定する
+    full_address = models.GeneratedField(
+        expression=Case(
+            When(
+                postal_code__gt='', address__gt='',
+                then=Concat(
+                    models.Value('〒'), 'postal_code', models.Value(' '), 'address',
+                    output_field=models.TextField()
+                )
+            ),
+            # 郵便番号（CharField）と住所（TextField）の混在のため出力型を指定する
+            default=Coalesce('address', models.Value(''), output_field=models.TextField()),
+        ),
+        output_field=models.TextField(),
+        db_persist=True,
+        verbose_name='完全な住所'
+    )
+
     phone_regex = RegexValidator(
         regex=r'^[0-9\-\+\(\)]+$',
         message='電話番号は数字、ハイフン、プラス記号、括弧のみ使用可能です'
@@ -170,6 +229,10 @@ class SupplierBranch(models.Model):
         verbose_name_plural = 'サプライヤー拠点一覧'
         ordering = ['supplier', 'branch_type', 'branch_name']
         db_table = 'supplier_branches'
+        indexes = [
+            # 一覧の並び替え（企業名・拠点種別・拠点名・ID）用
+            models.Index(fields=['supplier_company_name', 'branch_type', 'branch_name']),
+        ]
         constraints = [
             # 同じサプライヤーで同じ拠点名は禁止
             models.UniqueConstraint(
@@ -178,20 +241,21 @@ class SupplierBranch(models.Model):
             )
         ]
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 読み込み時のサプライヤー・有効フラグ（シグナルでの有効拠点数の更新に使用）
+        # only()・defer()で読み込まれていない場合はNoneとし、保存・削除時にDBの値を取得する
+        if {'supplier_id', 'is_active'} & self.get_deferred_fields():
+            self._original_active = None
+        else:
+            self._original_active = (self.supplier_id, self.is_active)
+
     def __str__(self):
         return f'{self.supplier.company_name} - {self.branch_name}'
+
+    # NOTE: サプライヤーの有効拠点数はシグナル（api/supplier/signals.py）で更新する
     
-    @property
-    def display_name(self):
-        """表示用の名前"""
-        return f'{self.supplier.company_name} {self.branch_name}'
-    
-    @property
-    def full_address(self):
-        """完全な住所"""
-        if self.postal_code and self.address:
-            return f'〒{self.postal_code} {self.address}'
-        return self.address or ''
+    # NOTE: display_name・full_addressプロパティはGeneratedFieldに置き換えたため削除
     
     @property
     def primary_contact(self):
@@ -337,6 +401,15 @@ class SupplierContact(models.Model):
             )
         ]
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 読み込み時の拠点・主担当フラグ（主担当の切り替え有無の判定に使用）
+        # only()・defer()で読み込まれていない場合はNoneとし、保存時にDBの値を取得する
+        if {'branch_id', 'is_primary'} & self.get_deferred_fields():
+            self._original_primary = None
+        else:
+            self._original_primary = (self.branch_id, self.is_primary)
+    
     def __str__(self):
         return f"{self.branch.display_name} - {self.name}"
     
@@ -358,14 +431,68 @@ class SupplierContact(models.Model):
                 'メールアドレスまたは電話番号のいずれかは必須です'
             )
     
-    def save(self, *args, **kwargs):
-        self.full_clean()
+    def save(self, *args, skip_validation=False, **kwargs):
+        """
+        保存時の処理
+        フォーム等で検証済みの場合は skip_validation=True で full_clean() を省略できる
+        """
+        if not skip_validation:
+            self.full_clean()
+        
+        if self._original_primary is None and not self._state.adding:
+            self._original_primary = SupplierContact.objects.filter(
+                pk=self.pk
+            ).order_by().values_list('branch_id', 'is_primary').first()
         
         # 主担当が複数にならないようにする（同じ拠点内で）
-        if self.is_primary:
+        # 既に同じ拠点の主担当だった場合は他の担当者を更新する必要がない
+        became_primary = (
+            self._state.adding or
+            self._original_primary != (self.branch_id, True)
+        )
+        if self.is_primary and became_primary:
             SupplierContact.objects.filter(
                 branch=self.branch,
                 is_primary=True
             ).exclude(pk=self.pk).update(is_primary=False)
         
-        super().save(*args, **kwargs)
\ No newline at end of file
+        super().save(*args, **kwargs)
+        self._original_primary = (self.branch_id, self.is_primary)
+    
+    @classmethod
+    def bulk_create_validated(cls, contacts, batch_size=1000):
+        """
+        担当者を一括登録する
+        各担当者の検証はまとめて行い、メールアドレスの重複は1回のクエリで確認する
+        NOTE: 登録済みの担当者の更新（bulk_create(update_conflicts=True)）は行わない
+              MySQLは条件付きの一意制約（unique_branch_email）を作成しないため、
+              ON DUPLICATE KEY UPDATEで拠点・メールアドレスの重複を検出できない
+        """
+        contacts = list(contacts)
+        for contact in contacts:
+            contact.full_clean(validate_unique=False, validate_constraints=False)
+        
+        # 同じ拠点で同じメールアドレスは禁止（登録対象内・登録済みの両方を確認）
+        email_keys = [(contact.branch_id, contact.email) for contact in contacts if contact.email]
+        if len(email_keys) != len(set(email_keys)):
+            raise ValidationError('同じ拠点で同じメールアドレスの担当者が含まれています')
+        if email_keys:
+            existing = set(cls.objects.filter(
+                branch_id__in={branch_id for branch_id, _ in email_keys},
+                email__in={email for _, email in email_keys}
+            ).values_list('branch_id', 'email'))
+            if existing & set(email_keys):
+                raise ValidationError('同じ拠点で同じメールアドレスの担当者が既に登録されています')
+        
+        # 主担当は拠点ごとに1名まで
+        primary_branch_ids = [contact.branch_id for contact in contacts if contact.is_primary]
+        if len(primary_branch_ids) != len(set(primary_branch_ids)):
+            raise ValidationError('同じ拠点に複数の主担当が含まれています')
+        
+        with transaction.atomic():
+            if primary_branch_ids:
+                cls.objects.filter(
+                    branch_id__in=primary_branch_ids,
+                    is_primary=True
+                ).update(is_primary=False)
+            return cls.objects.bulk_create(contacts, batch_size=batch_size)
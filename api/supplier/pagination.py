@@ -0,0 +1,8 @@
+# api/supplier/pagination.py
+
+from rest_framework.pagination import CursorPagination
+
+
+class SupplierBranchCursorPagination(CursorPagination):
+    """サプライヤー拠点一覧のカーソルページネーション（企業名・拠点種別・拠点名順、同じ場合はID順）"""
+    ordering = ('supplier_company_name', 'branch_type', 'branch_name', 'id')
@@ -1,6 +1,10 @@
 # api/supplier/serializers.py
 
+from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import serializers
+from api.common.cache import invalidate_list_cache
+from api.common.serializers import UniqueConstraintErrorMixin
+from api.purchases.serializers import PartListSerializer
 from api.supplier.models import Supplier, SupplierBranch, SupplierContact
 
 
@@ -38,6 +42,30 @@ class SupplierContactDetailSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
+class SupplierContactBulkListSerializer(serializers.ListSerializer):
+    """
+    サプライヤー担当者の一括登録用のシリアライザー（1回のINSERTでまとめて登録）
+    MySQLの一括INSERTは登録した行のIDを返さないため、レスポンスにIDは含めない
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 拠点・メールアドレスの重複は行ごとのSELECT（UniqueTogetherValidator）ではなく、
+        # bulk_create_validated()で全ての行をまとめて確認する
+        self.child.validators = []
+
+    def create(self, validated_data):
+        contacts = [SupplierContact(**attrs) for attrs in validated_data]
+        try:
+            created = SupplierContact.bulk_create_validated(contacts)
+        except DjangoValidationError as e:
+            raise serializers.ValidationError(e.messages)
+        
+        # bulk_create()ではシグナルが送られないため、一覧キャッシュを明示的に無効化
+        invalidate_list_cache('supplier')
+        return created
+
+
 class SupplierContactCreateUpdateSerializer(serializers.ModelSerializer):
     """サプライヤー担当者作成・更新用のシリアライザー"""
 
@@ -49,6 +77,7 @@ class SupplierContactCreateUpdateSerializer(serializers.ModelSerializer):
             'responsibility', 'responsibility_detail',
             'is_primary', 'is_active', 'notes'
         ]
+        list_serializer_class = SupplierContactBulkListSerializer
 
     def validate(self, attrs):
         """バリデーション"""
@@ -82,7 +111,12 @@ class SupplierBranchListSerializer(serializers.ModelSerializer):
 
     def get_primary_contact(self, obj):
         """主担当者情報を取得"""
-        primary = obj.primary_contact
+        # ビューでプリフェッチ済みの場合はそれを使用
+        contacts = getattr(obj, '_primary_contacts', None)
+        if contacts is None:
+            primary = obj.primary_contact
+        else:
+            primary = contacts[0] if contacts else None
         if primary:
             return {
                 'id': primary.id,
@@ -102,8 +136,8 @@ class SupplierBranchDetailSerializer(serializers.ModelSerializer):
     # 紐づく担当者一覧
     contacts = SupplierContactListSerializer(many=True, read_only=True)
     
-    # 紐づく部品情報
-    parts = serializers.SerializerMethodField()
+    # 紐づく有効な部品情報（ビューで有効な部品のみをPrefetch(to_attr='_active_parts')で取得する）
+    parts = PartListSerializer(source='_active_parts', many=True, read_only=True)
 
     class Meta:
         model = SupplierBranch
@@ -117,15 +151,15 @@ class SupplierBranchDetailSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
 
-    def get_parts(self, obj):
-        """関連する部品情報を取得"""
-        from api.purchases.serializers import PartListSerializer
-        parts = obj.parts.filter(is_active=True)
-        return PartListSerializer(parts, many=True).data
 
-
-class SupplierBranchCreateUpdateSerializer(serializers.ModelSerializer):
+class SupplierBranchCreateUpdateSerializer(UniqueConstraintErrorMixin, serializers.ModelSerializer):
     """サプライヤー拠点作成・更新用のシリアライザー"""
+    unique_error_messages = {
+        'branch_code': ('branch_code', "この拠点コードは既に使用されています"),
+        'unique_supplier_branch_name': (
+            'branch_name', "このサプライヤーには同じ拠点名が既に登録されています"
+        ),
+    }
 
     class Meta:
         model = SupplierBranch
@@ -136,20 +170,11 @@ class SupplierBranchCreateUpdateSerializer(serializers.ModelSerializer):
         ]
         extra_kwargs = {
             'supplier': {'required': True},
-            'branch_code': {'required': True},
+            # 重複はDBの一意制約で判定する（UniqueConstraintErrorMixin）
+            'branch_code': {'required': True, 'validators': []},
             'branch_name': {'required': True},
         }
-
-    def validate_branch_code(self, value):
-        """拠点コードの重複チェック"""
-        instance = self.instance
-        if instance:
-            if SupplierBranch.objects.filter(branch_code=value).exclude(pk=instance.pk).exists():
-                raise serializers.ValidationError("この拠点コードは既に使用されています")
-        else:
-            if SupplierBranch.objects.filter(branch_code=value).exists():
-                raise serializers.ValidationError("この拠点コードは既に使用されています")
-        return value
+        validators = []
 
 
 class SupplierListSerializer(serializers.ModelSerializer):
@@ -165,6 +190,21 @@ class SupplierListSerializer(serializers.ModelSerializer):
         ]
 
 
+# values()で取得する列（全てSupplierの列）
+SUPPLIER_LIST_VALUES = SupplierListSerializer.Meta.fields
+
+def serialize_supplier_rows(rows):
+    """
+    values()で取得した行をSupplierListSerializerと同じ形式の辞書に変換する
+    一覧表示でモデルの生成とフィールド解決を省略するために使用
+    日時はORJSONRendererでDateTimeFieldと同じ形式に変換する
+    """
+    return [
+        {field: row[field] for field in SupplierListSerializer.Meta.fields}
+        for row in rows
+    ]
+
+
 class SupplierDetailSerializer(serializers.ModelSerializer):
     """サプライヤー詳細用のシリアライザー（拠点情報を含む）"""
     active_branches_count = serializers.IntegerField(read_only=True)
@@ -182,8 +222,12 @@ class SupplierDetailSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
-class SupplierCreateUpdateSerializer(serializers.ModelSerializer):
+class SupplierCreateUpdateSerializer(UniqueConstraintErrorMixin, serializers.ModelSerializer):
     """サプライヤー作成・更新用のシリアライザー"""
+    unique_error_messages = {
+        'supplier_code': ('supplier_code', "このサプライヤーコードは既に使用されています"),
+        'company_name': ('company_name', "この企業名は既に登録されています"),
+    }
 
     class Meta:
         model = Supplier
@@ -191,29 +235,8 @@ class SupplierCreateUpdateSerializer(serializers.ModelSerializer):
             'supplier_code', 'company_name', 'website',
             'notes', 'is_active'
         ]
+        # 重複はDBの一意制約で判定する（UniqueConstraintErrorMixin）
         extra_kwargs = {
-            'supplier_code': {'required': True},
-            'company_name': {'required': True},
+            'supplier_code': {'required': True, 'validators': []},
+            'company_name': {'required': True, 'validators': []},
         }
-
-    def validate_supplier_code(self, value):
-        """サプライヤーコードの重複チェック"""
-        instance = self.instance
-        if instance:
-            if Supplier.objects.filter(supplier_code=value).exclude(pk=instance.pk).exists():
-                raise serializers.ValidationError("このサプライヤーコードは既に使用されています")
-        else:
-            if Supplier.objects.filter(supplier_code=value).exists():
-                raise serializers.ValidationError("このサプライヤーコードは既に使用されています")
-        return value
-
-    def validate_company_name(self, value):
-        """企業名の重複チェック"""
-        instance = self.instance
-        if instance:
-            if Supplier.objects.filter(company_name=value).exclude(pk=instance.pk).exists():
-                raise serializers.ValidationError("この企業名は既に登録されています")
-        else:
-            if Supplier.objects.filter(company_name=value).exists():
-                raise serializers.ValidationError("この企業名は既に登録されています")
-        return value
\ No newline at end of file
@@ -0,0 +1,94 @@
+# api/supplier/signals.py
+
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from api.common.cache import invalidate_list_cache
+from api.supplier.models import Supplier, SupplierBranch, SupplierContact
+
+
+def _load_original_active(instance):
+    """
+    読み込み時のサプライヤー・有効フラグが不明な場合（only()・defer()で読み込まれていない場合）はDBから取得
+    変更なしの保存を変更として扱い、有効拠点数がずれるのを防ぐ
+    """
+    if instance._original_active is None:
+        instance._original_active = SupplierBranch.objects.filter(
+            pk=instance.pk
+        ).order_by().values_list('supplier_id', 'is_active').first() or (None, False)
+
+
+@receiver(pre_save, sender=SupplierBranch)
+def set_branch_supplier_company_name(sender, instance, **kwargs):
+    """拠点の追加・サプライヤー変更時に企業名（表示名の生成元）を設定"""
+    if instance._state.adding:
+        instance.supplier_company_name = instance.supplier.company_name
+        return
+    _load_original_active(instance)
+    if instance._original_active[0] != instance.supplier_id:
+        instance.supplier_company_name = instance.supplier.company_name
+
+
+def _add_active_branches_count(supplier_id, delta):
+    Supplier.objects.filter(pk=supplier_id).update(
+        active_branches_count=F('active_branches_count') + delta
+    )
+
+
+@receiver(post_save, sender=SupplierBranch)
+def update_active_branches_count_on_save(sender, instance, created, **kwargs):
+    """
+    拠点の追加・有効フラグ・サプライヤーの変更時にサプライヤーの有効拠点数を更新
+    QuerySet.update()・bulk_update()では実行されないため、Supplier.recount_active_branches()で再集計する
+    """
+    original_supplier_id, original_is_active = (
+        (None, False) if created else instance._original_active
+    )
+    if (original_supplier_id, bool(original_is_active)) != (instance.supplier_id, instance.is_active):
+        if original_is_active and original_supplier_id:
+            _add_active_branches_count(original_supplier_id, -1)
+        if instance.is_active:
+            _add_active_branches_count(instance.supplier_id, 1)
+    instance._original_active = (instance.supplier_id, instance.is_active)
+
+
+@receiver(pre_delete, sender=SupplierBranch)
+def load_original_active_on_delete(sender, instance, **kwargs):
+    """削除前に読み込み時のサプライヤー・有効フラグを確定"""
+    _load_original_active(instance)
+
+
+@receiver(post_delete, sender=SupplierBranch)
+def update_active_branches_count_on_delete(sender, instance, **kwargs):
+    """
+    拠点の削除時にサプライヤーの有効拠点数を更新
+    QuerySet.delete()による一括削除（管理画面の一括削除など）でも実行される
+    """
+    original_supplier_id, original_is_active = instance._original_active
+    if original_is_active and original_supplier_id:
+        _add_active_branches_count(original_supplier_id, -1)
+
+
+@receiver(post_save, sender=Supplier)
+def sync_branch_supplier_company_name(sender, instance, created, **kwargs):
+    """サプライヤーの企業名が変更された場合に拠点の企業名を更新"""
+    if created:
+        return
+    SupplierBranch.objects.filter(supplier=instance).exclude(
+        supplier_company_name=instance.company_name
+    ).update(supplier_company_name=instance.company_name)
+
+
+# 一覧に表示される内容（企業名・拠点名・主担当者など）が変わるモデル
+LIST_CACHE_SENDERS = (Supplier, SupplierBranch, SupplierContact)
+
+
+def invalidate_supplier_list_cache(sender, **kwargs):
+    """サプライヤー・拠点・担当者一覧のキャッシュを無効化"""
+    invalidate_list_cache('supplier')
+
+
+for _sender in LIST_CACHE_SENDERS:
+    post_save.connect(invalidate_supplier_list_cache, sender=_sender)
+    post_delete.connect(invalidate_supplier_list_cache, sender=_sender)
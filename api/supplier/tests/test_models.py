@@ -0,0 +1,52 @@
+# api/supplier/tests/test_models.py
+
+from django.test import TestCase
+
+from api.supplier.models import Supplier, SupplierBranch
+
+
+class SupplierBranchGeneratedFieldTests(TestCase):
+    """拠点の表示名・完全な住所（GeneratedField）のテスト"""
+
+    def setUp(self):
+        self.supplier = Supplier.objects.create(supplier_code='SUP001', company_name='株式会社ABC')
+
+    def create_branch(self, **kwargs):
+        branch = SupplierBranch.objects.create(
+            supplier=self.supplier,
+            branch_code=kwargs.pop('branch_code', 'SUP001-HQ'),
+            branch_name=kwargs.pop('branch_name', '本社'),
+            **kwargs
+        )
+        branch.refresh_from_db()
+        return branch
+
+    def test_display_name(self):
+        branch = self.create_branch()
+        self.assertEqual(branch.display_name, '株式会社ABC 本社')
+
+    def test_display_name_follows_company_name(self):
+        branch = self.create_branch()
+        self.supplier.company_name = '株式会社XYZ'
+        self.supplier.save()
+
+        branch.refresh_from_db()
+        self.assertEqual(branch.display_name, '株式会社XYZ 本社')
+
+    def test_full_address_with_postal_code(self):
+        branch = self.create_branch(postal_code='460-0001', address='名古屋市中区')
+        self.assertEqual(branch.full_address, '〒460-0001 名古屋市中区')
+
+    def test_full_address_without_postal_code(self):
+        branch = self.create_branch(address='名古屋市中区')
+        self.assertEqual(branch.full_address, '名古屋市中区')
+
+    def test_full_address_without_address(self):
+        branch = self.create_branch(postal_code='460-0001')
+        self.assertEqual(branch.full_address, '')
+
+    def test_filter_by_full_address(self):
+        branch = self.create_branch(postal_code='460-0001', address='名古屋市中区')
+        self.assertQuerySetEqual(
+            SupplierBranch.objects.filter(full_address__startswith='〒460'), [branch]
+        )
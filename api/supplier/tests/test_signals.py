@@ -0,0 +1,127 @@
+# api/supplier/tests/test_signals.py
+
+from django.test import TestCase
+
+from api.supplier.models import Supplier, SupplierBranch, SupplierContact
+
+
+class ActiveBranchesCountTests(TestCase):
+    """サプライヤーの有効拠点数（シグナルで更新）のテスト"""
+
+    def setUp(self):
+        self.supplier = Supplier.objects.create(supplier_code='SUP001', company_name='株式会社ABC')
+        self.other = Supplier.objects.create(supplier_code='SUP002', company_name='株式会社XYZ')
+
+    def create_branch(self, code, **kwargs):
+        return SupplierBranch.objects.create(
+            supplier=kwargs.pop('supplier', self.supplier),
+            branch_code=code, branch_name=code, **kwargs
+        )
+
+    def assertCounts(self, supplier_count, other_count):
+        self.assertEqual(
+            list(Supplier.objects.order_by('supplier_code').values_list('active_branches_count', flat=True)),
+            [supplier_count, other_count]
+        )
+
+    def test_create(self):
+        self.create_branch('HQ')
+        self.create_branch('NAG', is_active=False)
+        self.assertCounts(1, 0)
+
+    def test_toggle_active(self):
+        branch = self.create_branch('HQ')
+        branch.is_active = False
+        branch.save()
+        self.assertCounts(0, 0)
+
+        branch.is_active = True
+        branch.save()
+        self.assertCounts(1, 0)
+
+    def test_unchanged_save(self):
+        branch = self.create_branch('HQ')
+        branch.branch_name = '本社'
+        branch.save()
+        self.assertCounts(1, 0)
+
+    def test_move_supplier(self):
+        branch = self.create_branch('HQ')
+        branch.supplier = self.other
+        branch.save()
+        self.assertCounts(0, 1)
+
+    def test_deferred_instance_save(self):
+        self.create_branch('HQ')
+        # 有効フラグ・サプライヤーを読み込まずに保存しても変更として扱わない
+        branch = SupplierBranch.objects.only('id', 'branch_name').get()
+        branch.branch_name = '本社'
+        branch.save()
+        self.assertCounts(1, 0)
+
+    def test_deferred_instance_deactivate(self):
+        self.create_branch('HQ')
+        branch = SupplierBranch.objects.only('id', 'branch_name').get()
+        branch.is_active = False
+        branch.save()
+        self.assertCounts(0, 0)
+
+    def test_deferred_instance_delete(self):
+        self.create_branch('HQ')
+        SupplierBranch.objects.only('id').get().delete()
+        self.assertCounts(0, 0)
+
+    def test_queryset_delete(self):
+        self.create_branch('HQ')
+        self.create_branch('NAG')
+        self.create_branch('OSA', is_active=False)
+        SupplierBranch.objects.all().delete()
+        self.assertCounts(0, 0)
+
+    def test_recount_after_queryset_update(self):
+        self.create_branch('HQ')
+        self.create_branch('NAG')
+        # update()ではシグナルが送られないため再集計する
+        SupplierBranch.objects.filter(branch_code='NAG').update(supplier=self.other)
+        self.assertCounts(2, 0)
+
+        Supplier.recount_active_branches()
+        self.assertCounts(1, 1)
+
+
+class PrimaryContactTests(TestCase):
+    """主担当者の切り替えのテスト"""
+
+    def setUp(self):
+        supplier = Supplier.objects.create(supplier_code='SUP001', company_name='株式会社ABC')
+        self.branch = SupplierBranch.objects.create(
+            supplier=supplier, branch_code='SUP001-HQ', branch_name='本社'
+        )
+        self.first = SupplierContact.objects.create(
+            branch=self.branch, name='山田', email='yamada@example.com', is_primary=True
+        )
+        self.second = SupplierContact.objects.create(
+            branch=self.branch, name='佐藤', email='sato@example.com'
+        )
+
+    def primary_names(self):
+        return list(SupplierContact.objects.filter(is_primary=True).values_list('name', flat=True))
+
+    def test_switch_primary(self):
+        self.second.is_primary = True
+        self.second.save()
+        self.assertEqual(self.primary_names(), ['佐藤'])
+
+    def test_switch_primary_on_deferred_instance(self):
+        contact = SupplierContact.objects.defer('is_primary').get(pk=self.second.pk)
+        contact.is_primary = True
+        contact.save()
+        self.assertEqual(self.primary_names(), ['佐藤'])
+
+    def test_resave_primary_keeps_others(self):
+        contact = SupplierContact.objects.defer('is_primary').get(pk=self.first.pk)
+        with self.assertNumQueries(3):
+            # 主担当のままの保存では他の担当者を更新しない
+            # （読み込み時の値の取得・主担当フラグの読み込み・保存のみ）
+            contact.save(skip_validation=True)
+        self.assertEqual(self.primary_names(), ['山田'])
@@ -0,0 +1,200 @@
+# api/supplier/tests/test_views.py
+
+import json
+from datetime import date
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from api.accounts.models import User
+from api.products.models import Product
+from api.purchases.models import Part, PriceHistory
+from api.supplier.models import Supplier, SupplierBranch, SupplierContact
+from api.supplier.pagination import SupplierBranchCursorPagination
+
+
+class SupplierBranchDetailViewTests(TestCase):
+    """拠点詳細（有効な部品を含む）のテスト"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('user1', 'user1@example.com', 'password')
+        supplier = Supplier.objects.create(supplier_code='SUP001', company_name='株式会社ABC')
+        cls.branch = SupplierBranch.objects.create(
+            supplier=supplier, branch_code='SUP001-HQ', branch_name='本社'
+        )
+        product = Product.objects.create(product_number='P001', product_name='製品A')
+        for number in range(3):
+            part = Part.objects.create(
+                product=product, supplier_branch=cls.branch,
+                part_number=f'PT00{number}', part_name=f'部品{number}'
+            )
+            PriceHistory.objects.create(part=part, price=100 + number, start_date=date(2020, 1, 1))
+        Part.objects.create(
+            product=product, supplier_branch=cls.branch,
+            part_number='PT999', part_name='廃止部品', is_active=False
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_active_parts_with_current_price(self):
+        response = self.client.get(f'/api/supplier/branches/{self.branch.pk}/')
+        self.assertEqual(response.status_code, 200)
+
+        parts = response.json()['parts']
+        self.assertEqual([part['part_number'] for part in parts], ['PT000', 'PT001', 'PT002'])
+        self.assertEqual([part['current_price'] for part in parts], ['100.00', '101.00', '102.00'])
+        self.assertEqual({part['supplier_name'] for part in parts}, {'株式会社ABC'})
+
+    def test_parts_fetched_in_one_query(self):
+        # 拠点・担当者・部品（製品・仕入先を結合）の3クエリ（部品数によらない）
+        # ＋ATOMIC_REQUESTSのセーブポイントの作成・解放
+        with self.assertNumQueries(5):
+            self.client.get(f'/api/supplier/branches/{self.branch.pk}/')
+
+
+class SupplierContactBulkCreateViewTests(TestCase):
+    """担当者の一括登録のテスト"""
+
+    url = '/api/supplier/contacts/bulk/'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('user1', 'user1@example.com', 'password')
+        supplier = Supplier.objects.create(supplier_code='SUP001', company_name='株式会社ABC')
+        cls.branch = SupplierBranch.objects.create(
+            supplier=supplier, branch_code='SUP001-HQ', branch_name='本社'
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def contacts(self, count, start=0):
+        return [
+            {'branch': self.branch.pk, 'name': f'担当者{i}', 'email': f'user{i}@example.com'}
+            for i in range(start, start + count)
+        ]
+
+    def test_create(self):
+        response = self.client.post(self.url, self.contacts(3), format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([row['name'] for row in response.json()], ['担当者0', '担当者1', '担当者2'])
+        self.assertNotIn('id', response.json()[0])
+        self.assertEqual(SupplierContact.objects.filter(branch=self.branch).count(), 3)
+
+    def test_duplicate_check_is_one_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(self.url, self.contacts(5), format='json')
+        # 行ごとのUniqueTogetherValidatorによるSELECTは行わない
+        contact_selects = [
+            query for query in queries.captured_queries
+            if query['sql'].startswith('SELECT') and 'FROM "supplier_contacts"' in query['sql']
+        ]
+        self.assertEqual(len(contact_selects), 1)
+
+    def test_duplicate_in_request(self):
+        contacts = self.contacts(2)
+        contacts[1]['email'] = contacts[0]['email']
+        response = self.client.post(self.url, contacts, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(SupplierContact.objects.exists())
+
+    def test_duplicate_with_existing(self):
+        self.client.post(self.url, self.contacts(1), format='json')
+        response = self.client.post(self.url, self.contacts(2), format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(SupplierContact.objects.count(), 1)
+
+
+class SupplierListViewTests(TestCase):
+    """サプライヤー一覧（values()の辞書から出力）のテスト"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('user1', 'user1@example.com', 'password')
+        cls.supplier = Supplier.objects.create(supplier_code='SUP001', company_name='株式会社ABC')
+        SupplierBranch.objects.create(
+            supplier=cls.supplier, branch_code='SUP001-HQ', branch_name='本社'
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_same_format_as_detail(self):
+        row = self.client.get('/api/supplier/suppliers/').json()['results'][0]
+        detail = self.client.get(f'/api/supplier/suppliers/{self.supplier.pk}/').json()
+
+        for key in ('id', 'supplier_code', 'company_name', 'active_branches_count', 'created_at', 'updated_at'):
+            self.assertEqual(row[key], detail[key], key)
+        self.assertTrue(row['created_at'].endswith('+09:00'))
+
+    def test_export(self):
+        response = self.client.get('/api/supplier/suppliers/export/')
+        rows = json.loads(b''.join(response.streaming_content))
+        self.assertEqual([row['supplier_code'] for row in rows], ['SUP001'])
+        self.assertTrue(rows[0]['created_at'].endswith('+09:00'))
+
+
+class SupplierBranchListViewTests(TestCase):
+    """拠点一覧（カーソルページネーション・検索）のテスト"""
+
+    url = '/api/supplier/branches/'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('user1', 'user1@example.com', 'password')
+        abc = Supplier.objects.create(supplier_code='SUP001', company_name='ABC商事')
+        xyz = Supplier.objects.create(supplier_code='SUP002', company_name='XYZ工業')
+        for supplier, code, name, branch_type in [
+            (xyz, 'XYZ-HQ', '本社', SupplierBranch.BranchType.HEAD_OFFICE),
+            (abc, 'ABC-NAG', '名古屋支店', SupplierBranch.BranchType.BRANCH),
+            (abc, 'ABC-HQ', '本社', SupplierBranch.BranchType.HEAD_OFFICE),
+            (abc, 'ABC-OSA', '大阪支店', SupplierBranch.BranchType.BRANCH),
+            (xyz, 'XYZ-FAC', '安城工場', SupplierBranch.BranchType.FACTORY),
+        ]:
+            SupplierBranch.objects.create(
+                supplier=supplier, branch_code=code, branch_name=name, branch_type=branch_type
+            )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def branch_codes(self, params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return [row['branch_code'] for row in response.json()['results']]
+
+    def test_cursor_pagination(self):
+        seen = []
+        with mock.patch.object(SupplierBranchCursorPagination, 'page_size', 2):
+            url = self.url
+            while url:
+                data = self.client.get(url).json()
+                seen.extend(row['branch_code'] for row in data['results'])
+                url = data['next']
+        # 企業名・拠点種別・拠点名の順
+        self.assertEqual(seen, ['ABC-NAG', 'ABC-OSA', 'ABC-HQ', 'XYZ-FAC', 'XYZ-HQ'])
+
+    def test_search_company_name(self):
+        self.assertEqual(self.branch_codes({'search': 'XYZ工業'}), ['XYZ-FAC', 'XYZ-HQ'])
+
+    def test_search_branch_name(self):
+        self.assertEqual(self.branch_codes({'search': '支店'}), ['ABC-NAG', 'ABC-OSA'])
+
+    def test_filter_branch_type(self):
+        self.assertEqual(self.branch_codes({'branch_type': 'HEAD_OFFICE'}), ['ABC-HQ', 'XYZ-HQ'])
+
+    def test_invalid_branch_type(self):
+        response = self.client.get(self.url, {'branch_type': 'UNKNOWN'})
+        self.assertEqual(response.status_code, 400)
@@ -3,10 +3,12 @@
 from django.urls import path
 from api.supplier.views import (
     SupplierListCreateView,
+    SupplierExportView,
     SupplierDetailView,
     SupplierBranchListCreateView,
     SupplierBranchDetailView,
     SupplierContactListCreateView,
+    SupplierContactBulkCreateView,
     SupplierContactDetailView,
 )
 
@@ -15,6 +17,7 @@ app_name = 'supplier'
 urlpatterns = [
     # サプライヤー関連
     path('suppliers/', SupplierListCreateView.as_view(), name='supplier_list_create'),
+    path('suppliers/export/', SupplierExportView.as_view(), name='supplier_export'),
     path('suppliers/<int:pk>/', SupplierDetailView.as_view(), name='supplier_detail'),
     
     # サプライヤー拠点関連
@@ -23,5 +26,6 @@ urlpatterns = [
     
     # サプライヤー担当者関連
     path('contacts/', SupplierContactListCreateView.as_view(), name='contact_list_create'),
+    path('contacts/bulk/', SupplierContactBulkCreateView.as_view(), name='contact_bulk_create'),
     path('contacts/<int:pk>/', SupplierContactDetailView.as_view(), name='contact_detail'),
 ]
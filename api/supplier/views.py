@@ -2,9 +2,17 @@
 
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
-from django.db.models import Count, Q
-
+from django.db.models import Prefetch
+from django.http import StreamingHttpResponse
+from django_filters.rest_framework import DjangoFilterBackend
+
+from api.common.cache import CachedListMixin
+from api.common.queries import AutoPrefetchMixin, serializer_only_fields
+from api.common.renderers import stream_json_array
+from api.purchases.models import Part
+from api.supplier.filters import SupplierBranchFilter, SupplierContactFilter, SupplierFilter
 from api.supplier.models import Supplier, SupplierBranch, SupplierContact
+from api.supplier.pagination import SupplierBranchCursorPagination
 from api.supplier.serializers import (
     SupplierListSerializer,
     SupplierDetailSerializer,
@@ -15,6 +23,8 @@ from api.supplier.serializers import (
     SupplierContactListSerializer,
     SupplierContactDetailSerializer,
     SupplierContactCreateUpdateSerializer,
+    SUPPLIER_LIST_VALUES,
+    serialize_supplier_rows,
 )
 
 
@@ -29,49 +39,83 @@ class IsAdminUser(permissions.BasePermission):
         )
 
 
+def primary_contact_prefetch():
+    """拠点の主担当者（有効なもの）をまとめて取得するPrefetch"""
+    return Prefetch(
+        'contacts',
+        queryset=SupplierContact.objects.filter(
+            is_primary=True, is_active=True
+        ).only(
+            'id', 'branch', 'name', 'email', 'phone_number'
+        ).order_by('name'),
+        to_attr='_primary_contacts'
+    )
+
+
 # ==================== Supplier Views ====================
 
-class SupplierListCreateView(generics.ListCreateAPIView):
-    """サプライヤー一覧取得・作成ビュー"""
+class SupplierListCreateView(AutoPrefetchMixin, CachedListMixin, generics.ListCreateAPIView):
+    """サプライヤー一覧取得・作成ビュー（一覧は短時間キャッシュ、絞り込みはSupplierFilterで行う）"""
     permission_classes = [permissions.IsAuthenticated]
-
-    def get_queryset(self):
-        """クエリセットを取得"""
-        queryset = Supplier.objects.annotate(
-            active_branches_count=Count('branches', filter=Q(branches__is_active=True))
-        )
-        
-        # フィルタリング
-        is_active = self.request.query_params.get('is_active', None)
-        if is_active is not None:
-            queryset = queryset.filter(is_active=is_active.lower() == 'true')
-        
-        search = self.request.query_params.get('search', None)
-        if search:
-            queryset = queryset.filter(
-                Q(supplier_code__icontains=search) |
-                Q(company_name__icontains=search)
-            )
-        
-        return queryset.order_by('company_name')
+    queryset = Supplier.objects.order_by('company_name')
+    list_cache_namespace = 'supplier'
+    list_cache_prefix = 'suppliers'
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = SupplierFilter
 
     def get_serializer_class(self):
         if self.request.method == 'POST':
             return SupplierCreateUpdateSerializer
         return SupplierListSerializer
 
+    def _build_list_data(self):
+        """サプライヤー一覧のデータを生成（モデルを生成せずvalues()の辞書から返す）"""
+        queryset = self.filter_queryset(self.get_queryset()).values(*SUPPLIER_LIST_VALUES)
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serialize_supplier_rows(page)).data
+
+        return serialize_supplier_rows(queryset)
 
-class SupplierDetailView(generics.RetrieveUpdateDestroyAPIView):
+
+class SupplierExportView(generics.GenericAPIView):
+    """
+    サプライヤー一覧のエクスポートビュー（ページネーションなし）
+    一覧と同じ絞り込みを使用し、サーバー側でまとめて保持せずに逐次出力する
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    queryset = Supplier.objects.order_by('company_name')
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = SupplierFilter
+    # 一度にデータベースから取得する行数
+    chunk_size = 2000
+
+    def get(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset()).values(*SUPPLIER_LIST_VALUES)
+        return StreamingHttpResponse(
+            stream_json_array(self._export_rows(queryset)),
+            content_type='application/json'
+        )
+
+    def _export_rows(self, queryset):
+        for row in queryset.iterator(chunk_size=self.chunk_size):
+            yield from serialize_supplier_rows([row])
+
+
+class SupplierDetailView(AutoPrefetchMixin, generics.RetrieveUpdateDestroyAPIView):
     """サプライヤー詳細取得・更新・削除ビュー"""
     permission_classes = [permissions.IsAuthenticated]
+    # 拠点はSupplierBranchListSerializerで使用する列のみ取得し、担当者は主担当者のみ取得
+    # 同じ拠点のプリフェッチをAutoPrefetchMixinより先に指定する必要があるため、querysetで指定
+    queryset = Supplier.objects.prefetch_related(Prefetch(
+        'branches',
+        queryset=SupplierBranch.objects.only(
+            *serializer_only_fields(SupplierBranchListSerializer)
+        ).prefetch_related(primary_contact_prefetch())
+    ))
     lookup_field = 'pk'
 
-    def get_queryset(self):
-        """クエリセットを取得"""
-        return Supplier.objects.annotate(
-            active_branches_count=Count('branches', filter=Q(branches__is_active=True))
-        ).prefetch_related('branches__contacts')
-
     def get_serializer_class(self):
         if self.request.method in ['PUT', 'PATCH']:
             return SupplierCreateUpdateSerializer
@@ -100,36 +144,23 @@ class SupplierDetailView(generics.RetrieveUpdateDestroyAPIView):
 
 # ==================== SupplierBranch Views ====================
 
-class SupplierBranchListCreateView(generics.ListCreateAPIView):
-    """サプライヤー拠点一覧取得・作成ビュー"""
+class SupplierBranchListCreateView(AutoPrefetchMixin, CachedListMixin, generics.ListCreateAPIView):
+    """サプライヤー拠点一覧取得・作成ビュー（一覧は短時間キャッシュ）"""
     permission_classes = [permissions.IsAuthenticated]
+    queryset = SupplierBranch.objects.all()
+    list_cache_namespace = 'supplier'
+    list_cache_prefix = 'branches'
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = SupplierBranchFilter
+    pagination_class = SupplierBranchCursorPagination
 
     def get_queryset(self):
-        """クエリセットを取得"""
-        queryset = SupplierBranch.objects.select_related('supplier').prefetch_related('contacts')
-        
-        # フィルタリング
-        supplier_id = self.request.query_params.get('supplier', None)
-        if supplier_id:
-            queryset = queryset.filter(supplier_id=supplier_id)
-        
-        branch_type = self.request.query_params.get('branch_type', None)
-        if branch_type:
-            queryset = queryset.filter(branch_type=branch_type)
-        
-        is_active = self.request.query_params.get('is_active', None)
-        if is_active is not None:
-            queryset = queryset.filter(is_active=is_active.lower() == 'true')
-        
-        search = self.request.query_params.get('search', None)
-        if search:
-            queryset = queryset.filter(
-                Q(branch_code__icontains=search) |
-                Q(branch_name__icontains=search) |
-                Q(supplier__company_name__icontains=search)
-            )
-        
-        return queryset.order_by('supplier', 'branch_type', 'branch_name')
+        """クエリセットを取得（絞り込みはSupplierBranchFilter、並び順はSupplierBranchCursorPaginationで行う）"""
+        # SupplierBranchListSerializerで使用する列のみ取得（企業名はカーソルの生成に使用）
+        return super().get_queryset().only(
+            *serializer_only_fields(SupplierBranchListSerializer),
+            'supplier_company_name'
+        ).prefetch_related(primary_contact_prefetch())
 
     def get_serializer_class(self):
         if self.request.method == 'POST':
@@ -137,19 +168,28 @@ class SupplierBranchListCreateView(generics.ListCreateAPIView):
         return SupplierBranchListSerializer
 
 
-class SupplierBranchDetailView(generics.RetrieveUpdateDestroyAPIView):
+class SupplierBranchDetailView(AutoPrefetchMixin, generics.RetrieveUpdateDestroyAPIView):
     """サプライヤー拠点詳細取得・更新・削除ビュー"""
     permission_classes = [permissions.IsAuthenticated]
+    queryset = SupplierBranch.objects.all()
     lookup_field = 'pk'
 
     def get_queryset(self):
         """クエリセットを取得"""
-        return SupplierBranch.objects.select_related(
-            'supplier'
-        ).prefetch_related(
-            'contacts',
-            'parts__product'
+        queryset = super().get_queryset()
+        
+        # 削除時は有効な部品の有無のみ確認するため、部品の取得は行わない
+        if self.request.method == 'DELETE':
+            return queryset
+        
+        # 有効な部品のみをまとめて取得（PartListSerializerで使用する列のみ）
+        active_parts_prefetch = Prefetch(
+            'parts',
+            queryset=Part.objects.filter(is_active=True).with_list_joins(),
+            to_attr='_active_parts'
         )
+        
+        return queryset.prefetch_related(active_parts_prefetch)
 
     def get_serializer_class(self):
         if self.request.method in ['PUT', 'PATCH']:
@@ -179,47 +219,21 @@ class SupplierBranchDetailView(generics.RetrieveUpdateDestroyAPIView):
 
 # ==================== SupplierContact Views ====================
 
-class SupplierContactListCreateView(generics.ListCreateAPIView):
-    """サプライヤー担当者一覧取得・作成ビュー"""
+class SupplierContactListCreateView(AutoPrefetchMixin, CachedListMixin, generics.ListCreateAPIView):
+    """サプライヤー担当者一覧取得・作成ビュー（一覧は短時間キャッシュ）"""
     permission_classes = [permissions.IsAuthenticated]
+    queryset = SupplierContact.objects.order_by('branch', '-is_primary', 'name')
+    list_cache_namespace = 'supplier'
+    list_cache_prefix = 'contacts'
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = SupplierContactFilter
 
     def get_queryset(self):
-        """クエリセットを取得"""
-        queryset = SupplierContact.objects.select_related(
-            'branch__supplier'
+        """クエリセットを取得（絞り込みはSupplierContactFilterで行う）"""
+        # SupplierContactListSerializerで使用する列のみ取得（拠点名・企業名以外の関連先の列は取得しない）
+        return super().get_queryset().only(
+            *serializer_only_fields(SupplierContactListSerializer)
         )
-        
-        # フィルタリング
-        branch_id = self.request.query_params.get('branch', None)
-        if branch_id:
-            queryset = queryset.filter(branch_id=branch_id)
-        
-        supplier_id = self.request.query_params.get('supplier', None)
-        if supplier_id:
-            queryset = queryset.filter(branch__supplier_id=supplier_id)
-        
-        responsibility = self.request.query_params.get('responsibility', None)
-        if responsibility:
-            queryset = queryset.filter(responsibility=responsibility)
-        
-        is_active = self.request.query_params.get('is_active', None)
-        if is_active is not None:
-            queryset = queryset.filter(is_active=is_active.lower() == 'true')
-        
-        is_primary = self.request.query_params.get('is_primary', None)
-        if is_primary is not None:
-            queryset = queryset.filter(is_primary=is_primary.lower() == 'true')
-        
-        search = self.request.query_params.get('search', None)
-        if search:
-            queryset = queryset.filter(
-                Q(name__icontains=search) |
-                Q(name_kana__icontains=search) |
-                Q(email__icontains=search) |
-                Q(department__icontains=search)
-            )
-        
-        return queryset.order_by('branch', '-is_primary', 'name')
 
     def get_serializer_class(self):
         if self.request.method == 'POST':
@@ -227,17 +241,25 @@ class SupplierContactListCreateView(generics.ListCreateAPIView):
         return SupplierContactListSerializer
 
 
-class SupplierContactDetailView(generics.RetrieveUpdateDestroyAPIView):
+class SupplierContactBulkCreateView(generics.CreateAPIView):
+    """
+    サプライヤー担当者一括登録ビュー（リクエストは担当者の配列）
+    レスポンスは登録した担当者の配列（IDを含まない、SupplierContactBulkListSerializerを参照）
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = SupplierContactCreateUpdateSerializer
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs['many'] = True
+        return super().get_serializer(*args, **kwargs)
+
+
+class SupplierContactDetailView(AutoPrefetchMixin, generics.RetrieveUpdateDestroyAPIView):
     """サプライヤー担当者詳細取得・更新・削除ビュー"""
     permission_classes = [permissions.IsAuthenticated]
+    queryset = SupplierContact.objects.all()
     lookup_field = 'pk'
 
-    def get_queryset(self):
-        """クエリセットを取得"""
-        return SupplierContact.objects.select_related(
-            'branch__supplier'
-        )
-
     def get_serializer_class(self):
         if self.request.method in ['PUT', 'PATCH']:
             return SupplierContactCreateUpdateSerializer
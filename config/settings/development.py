@@ -21,6 +21,9 @@ DATABASES = {
         'HOST': config('DB_HOST', default='host.docker.internal'),
         'PORT': config('DB_PORT', default='53306'),
         'ATOMIC_REQUESTS': True,
+        # 持続的接続（リクエスト毎の接続・認証処理を省略）
+        'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=600, cast=int),
+        'CONN_HEALTH_CHECKS': True,
         'OPTIONS': {
             'charset': 'utf8mb4',
         },
@@ -56,5 +59,11 @@ LOGGING = {
             'level': 'INFO',
             'propagate': False,
         },
+        # SQLのログは既定で出力しない（確認する場合は.envでDB_LOG_LEVEL=DEBUGを指定）
+        'django.db.backends': {
+            'handlers': ['console'],
+            'level': config('DB_LOG_LEVEL', default='WARNING'),
+            'propagate': False,
+        },
     },
 }
\ No newline at end of file
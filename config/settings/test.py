@@ -0,0 +1,27 @@
+"""
+Test settings - テスト実行用
+DJANGO_SETTINGS_MODULE=config.settings.test python manage.py test
+"""
+
+from .base import *
+
+# テストはMySQLサーバーなしで実行できるようSQLiteを使用する
+# （FULLTEXTインデックスなどMySQL専用の処理はicontains等に切り替わる）
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+        'ATOMIC_REQUESTS': True,
+    }
+}
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# テストの高速化のため軽量なハッシュを使用
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]